@@ -139,6 +139,8 @@ import os.path
 import logging.handlers
 from enum import Enum
 import time
+import threading
+import asyncio
 import warnings
 import glob
 from jinja2 import Template
@@ -201,13 +203,16 @@ class RateLimiter:
     def __init__(self, calls_per_second: float):
         self.min_interval = 1.0 / calls_per_second
         self.last_call = 0.0
+        self._lock = threading.Lock()
 
     def wait(self):
-        now = time.time()
-        elapsed = now - self.last_call
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_call = time.time()
+        # Called from worker threads when several checks run concurrently
+        with self._lock:
+            now = time.time()
+            elapsed = now - self.last_call
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+            self.last_call = time.time()
 
 # Initialize rate limiter
 api_rate_limiter = RateLimiter(DEFAULT_CONFIG['api_rate_limit'])
@@ -389,14 +394,15 @@ return only the JSON array, no other text or comments.
 
 {custom_prompt if custom_prompt else ''}"""
 
-            # Add rate limiting before API calls
-            api_rate_limiter.wait()
+            # Add rate limiting before API calls; run blocking work off the event
+            # loop so concurrent checks on other pages keep making progress
+            await asyncio.to_thread(api_rate_limiter.wait)
             
             # Add retries for API calls
             retries = DEFAULT_CONFIG['max_retries']
             while retries > 0:
                 try:
-                    vision_response = chat_vision(vision_prompt, screenshot_base64)
+                    vision_response = await asyncio.to_thread(chat_vision, vision_prompt, screenshot_base64)
                     print(f"AI Analysis Results from {tester['name']}:%s" % (vision_response))
                     break
                 except Exception as e:
@@ -404,7 +410,7 @@ return only the JSON array, no other text or comments.
                     if retries == 0:
                         raise
                     logger.warning(f"API call failed, retrying... ({retries} attempts left)")
-                    time.sleep(2)
+                    await asyncio.sleep(2)
                     
             
             
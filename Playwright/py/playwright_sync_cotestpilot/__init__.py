@@ -130,8 +130,8 @@ from typing import Optional, Dict, Any, Union, List, TypedDict
 from playwright.sync_api import Page as SyncPage
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-import inspect
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import os
 import json
@@ -141,8 +141,24 @@ from enum import Enum
 import time
 import warnings
 import glob
+import functools
 import shutil
-from jinja2 import Template
+import base64
+import io
+from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; screenshots are sent as captured
+    Image = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
 
 # Suppress urllib3 deprecation warnings
 warnings.filterwarnings('ignore', category=DeprecationWarning, module='urllib3')
@@ -150,6 +166,18 @@ warnings.filterwarnings('ignore', category=DeprecationWarning, module='urllib3')
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize obj to compact JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
 @dataclass
 class CheckResult:
     """Contains the results of a page check operation."""
@@ -160,23 +188,49 @@ class CheckResult:
     profile: str
     output_file: Optional[str] = None  # Add new field for output file path
 
-try:
-    # Get the directory containing this file
-    package_dir = os.path.dirname(os.path.abspath(__file__))
-    testers_path = os.path.join(package_dir, 'testers.json')
-    
-    with open(testers_path, 'r') as f:
-        TESTERS = json.load(f)['testers']
-    logger.info(f"Loaded {len(TESTERS)} testers from {testers_path}")
-except FileNotFoundError:
-    logger.warning(f"testers.json not found at {testers_path}. No testing agents will be available.")
-    TESTERS = []
-except json.JSONDecodeError:
-    logger.error(f"testers.json at {testers_path} is invalid. No testing agents will be available.")
-    TESTERS = []
-except KeyError:
-    logger.error(f"testers.json at {testers_path} missing 'reporters' key. No testing agents will be available.")
-    TESTERS = []
+# Get the directory containing this file
+package_dir = os.path.dirname(os.path.abspath(__file__))
+testers_path = os.path.join(package_dir, 'testers.json')
+template_path = os.path.join(package_dir, 'report_template.html')
+
+# Jinja environment for the HTML report; compiled templates are cached by the environment
+_jinja_env = Environment(
+    loader=FileSystemLoader(package_dir),
+    autoescape=select_autoescape(['html'])
+)
+
+@functools.lru_cache(maxsize=1)
+def _get_testers() -> List[Dict[str, Any]]:
+    """Load the testing agents from testers.json on first use"""
+    try:
+        with open(testers_path, 'r') as f:
+            testers = json.load(f)['testers']
+        logger.info(f"Loaded {len(testers)} testers from {testers_path}")
+        return testers
+    except FileNotFoundError:
+        logger.warning(f"testers.json not found at {testers_path}. No testing agents will be available.")
+    except json.JSONDecodeError:
+        logger.error(f"testers.json at {testers_path} is invalid. No testing agents will be available.")
+    except KeyError:
+        logger.error(f"testers.json at {testers_path} missing 'reporters' key. No testing agents will be available.")
+    return []
+
+@functools.lru_cache(maxsize=1)
+def _get_tester_index():
+    """
+    Lowercase name lookups for tester selection.
+
+    Returns:
+        Tuple of (testers by lowercase name, lowercase names, default tester)
+    """
+    testers_by_lower_name = {t['name'].lower(): t for t in _get_testers()}
+    return testers_by_lower_name, list(testers_by_lower_name), testers_by_lower_name.get('jason')
+
+def __getattr__(name):
+    # Keep TESTERS available as a module attribute without loading it at import
+    if name == 'TESTERS':
+        return _get_testers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class LogLevel(Enum):
     NONE = 0
@@ -198,20 +252,131 @@ DEFAULT_CONFIG = Config(
 
 # Add rate limiting
 class RateLimiter:
-    def __init__(self, calls_per_second: float):
-        self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0.0
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill at calls_per_second up to burst, so idle time allows short
+    bursts without raising the steady-state rate.
+    """
+    def __init__(self, calls_per_second: float, burst: float = 1.0):
+        self._rate = calls_per_second
+        self._capacity = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, calls_per_second: float):
+        """Change the refill rate, keeping tokens already earned at the old rate"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            self._rate = calls_per_second
 
     def wait(self):
-        now = time.time()
-        elapsed = now - self.last_call
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_call = time.time()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self._rate
+            # Sleep outside the lock so other callers can refill and check
+            time.sleep(delay)
+
+# Screenshot retention; sweeps run at most once per interval per process
+SCREENSHOT_DIR = "screenshots"
+SCREENSHOT_SWEEP_INTERVAL = 3600  # seconds
+_sweep_lock = threading.Lock()
+_last_sweep = None
+
+def _sweep_screenshots(directory: str = SCREENSHOT_DIR, days: Optional[int] = None) -> None:
+    """
+    Delete check screenshots older than screenshot_retention_days.
+
+    Args:
+        directory: Directory holding the screenshots
+        days: Retention period in days (default: DEFAULT_CONFIG['screenshot_retention_days'])
+    """
+    global _last_sweep
+    with _sweep_lock:
+        now = time.monotonic()
+        if _last_sweep is not None and now - _last_sweep < SCREENSHOT_SWEEP_INTERVAL:
+            return
+        _last_sweep = now
+    
+    days = days or DEFAULT_CONFIG['screenshot_retention_days']
+    cutoff = time.time() - days * 86400
+    removed = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('check_') and entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+    except OSError as e:
+        logger.warning(f"Error sweeping screenshots in {directory}: {str(e)}")
+    if removed:
+        logger.info(f"Removed {removed} screenshots older than {days} days from {directory}")
+
+# Summary of saved check results, one JSON line per check
+RESULTS_INDEX_FILE = 'index.jsonl'
 
 # Initialize rate limiter
 api_rate_limiter = RateLimiter(DEFAULT_CONFIG['api_rate_limit'])
 
+# Screenshot preprocessing for the vision API
+MAX_IMAGE_DIM = 1280
+JPEG_QUALITY = 75
+
+def _encode_screenshot(image_bytes: bytes) -> str:
+    """
+    Downscale a screenshot and re-encode it as JPEG before base64 encoding.
+
+    JPEG captures that already fit within MAX_IMAGE_DIM are sent as is.
+    Falls back to encoding the original bytes when Pillow is not installed.
+    """
+    if Image is not None:
+        try:
+            img = Image.open(io.BytesIO(image_bytes))
+            if img.format == 'JPEG' and max(img.size) <= MAX_IMAGE_DIM:
+                return base64.b64encode(image_bytes).decode('ascii')
+            img.thumbnail((MAX_IMAGE_DIM, MAX_IMAGE_DIM), Image.LANCZOS)
+            buf = io.BytesIO()
+            img.convert('RGB').save(buf, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+            image_bytes = buf.getvalue()
+        except Exception as e:
+            logger.warning(f"Could not preprocess screenshot, sending original: {str(e)}")
+    return base64.b64encode(image_bytes).decode('ascii')
+
+# Page text whitespace normalization
+_SPACES_RE = re.compile(r'[ \t\r\f\v]+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n+')
+
+_TRUNCATION_MARKER = "\n…[truncated]…\n"
+
+def _truncate_page_text(page_text: str, max_chars: Optional[int]) -> str:
+    """
+    Collapse redundant whitespace and keep the head and tail of long page text.
+
+    Args:
+        page_text: Visible text of the page
+        max_chars: Maximum characters to keep, or None/0 for no limit
+    """
+    original_length = len(page_text)
+    page_text = _BLANK_LINES_RE.sub('\n', _SPACES_RE.sub(' ', page_text))
+    if max_chars and len(page_text) > max_chars:
+        # The marker counts toward the limit, so the result never outgrows it
+        half = (max_chars - len(_TRUNCATION_MARKER)) // 2
+        if half > 0:
+            page_text = page_text[:half] + _TRUNCATION_MARKER + page_text[len(page_text) - half:]
+        else:
+            page_text = page_text[:max_chars]
+    logger.debug(f"Page text length: {original_length} -> {len(page_text)} characters")
+    return page_text
+
 # Configure logging with file handler
 def configure_logging(
     level: str = "INFO",
@@ -229,6 +394,7 @@ def configure_logging(
     global DEFAULT_CONFIG
     if config:
         DEFAULT_CONFIG.update(config)
+        api_rate_limiter.set_rate(DEFAULT_CONFIG['api_rate_limit'])
     try:
         logging_level = getattr(logging, level.upper())
         logger = logging.getLogger(__name__)
@@ -264,86 +430,8 @@ def configure_logging(
         # Fallback to basic configuration
         logging.basicConfig(level=logging.INFO)
 
-def check(self, 
-          profile_search: Optional[str] = None,
-          custom_rules: Optional[Dict[str, Any]] = None,
-          custom_prompt: Optional[str] = None,
-          output: str = 'return list of issues as an array of JSON objects with properties: title, severity, description, why_fix, how_to_fix, confidence (a number between 0 and 1)',
-          testers: Optional[List[str]] = None,
-          label: Optional[str] = None,
-          timeout: int = 30000,
-          console_verbosity: LogLevel = LogLevel.BASIC,
-          save_to_file: bool = True,
-          output_dir: Optional[str] = "ai_check_results") -> CheckResult:
-    """
-    Performs an AI-powered check of the current page.
-    
-    Args:
-        profile_search: Optional string to specify the type of check to perform
-        custom_rules: Optional dictionary of custom rules to apply
-        custom_prompt: Optional string to append to the vision analysis prompt
-        output: Format specification for the output
-        testers: Optional list of tester names to use. If None, all testers will be used
-        label: Optional label for saving results to a specific JSON file
-        timeout: Maximum time in milliseconds to wait for check completion
-        save_to_file: Whether to save results to a JSON file (default: True)
-        output_dir: Optional directory path where to save results (default: current directory)
-        
-    Returns:
-        CheckResult object containing any issues found
-    """
-    try:
-        logger.info(f"Starting page check with profile: {profile_search}")
-        
-       
-        
-        # Ensure screenshot directory exists
-        os.makedirs("screenshots", exist_ok=True)
-        
-        # Capture and save screenshot
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = f"screenshots/check_{timestamp}.png"
-        self.screenshot(path=screenshot_path, type='png')
-        
-        # Convert screenshot to base64
-        with open(screenshot_path, "rb") as image_file:
-            import base64
-            screenshot_base64 = base64.b64encode(image_file.read()).decode('utf-8')
-        
-        # Validate inputs
-        if timeout < 1000:
-            logger.warning("Timeout too low, setting to minimum 1000ms")
-            timeout = 1000
-            
-        if custom_rules is not None and not isinstance(custom_rules, dict):
-            logger.error("custom_rules must be a dictionary")
-            raise ValueError("custom_rules must be a dictionary")
-
-        # Select testers - default to just Jason if no testers specified
-        selected_testers = []
-        
-        if testers is None:
-            selected_testers = [t for t in TESTERS if t['name'].lower() == 'jason']
-        else:
-            # Case-insensitive matching for tester names
-            selected_testers = [
-                t for t in TESTERS 
-                if any(requested.lower() in t['name'].lower() for requested in testers)
-            ]
-            if not selected_testers:
-                logger.warning(f"No matching testers found for {testers}. Using Jason as default tester.")
-                selected_testers = [t for t in TESTERS if t['name'].lower() == 'jason']
-        
-        # Get current page URL and content
-        url = self.url
-        page_text = self.evaluate('() => document.body.innerText')
-        
-        all_findings = []
-        
-        # Run analysis with each selected tester
-        for tester in selected_testers:
-            # Generate vision prompt for this specific tester
-            vision_prompt = f"""Please analyze this webpage for any errors, issues, or problems.
+# Vision prompt shared by all testers; filled in with str.format per tester
+_PROMPT_TEMPLATE = """Please analyze this webpage for any errors, issues, or problems.
 
 IMPORTANT: Only return high-confidence issues. It is perfectly acceptable to return no issues if none are found with high confidence.
 For each issue found, include a confidence score between 0 and 1, where:
@@ -362,8 +450,8 @@ Page URL: {url}
 Page Text Content:
 {page_text}
 
-You are {tester['name']}, and this is your expertise and background:
-{tester['biography']}
+You are {name}, and this is your expertise and background:
+{biography}
 
 Please identify any:
 1. Visual errors or layout issues
@@ -388,124 +476,372 @@ Example format:
 
 return only the JSON array, no other text or comments.
 
-{custom_prompt if custom_prompt else ''}"""
+{custom_prompt}"""
 
-            # Add rate limiting before API calls
-            api_rate_limiter.wait()
-            
-            # Add retries for API calls
-            retries = DEFAULT_CONFIG['max_retries']
-            while retries > 0:
-                try:
-                    vision_response = chat_vision(vision_prompt, screenshot_base64)
-                    print('vision_response', vision_response)
-                    break
-                except Exception as e:
-                    retries -= 1
-                    if retries == 0:
-                        raise
-                    logger.warning(f"API call failed, retrying... ({retries} attempts left)")
-                    time.sleep(2)
-                    
-            print(f"AI Analysis Results from {tester['name']}:")
-            print(vision_response)
-            
+def _run_one_tester(tester: Dict[str, Any],
+                    prompt_kwargs: Dict[str, str],
+                    image_url_obj: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Runs the vision analysis for a single tester.
+
+    prompt_kwargs holds the per-check values of _PROMPT_TEMPLATE
+    (url, page_text, output and custom_prompt).
+
+    Safe to call from worker threads; the shared rate limiter is thread-safe.
+
+    Returns:
+        Findings dict with the tester's name, biography and issues
+    """
+    # Generate vision prompt for this specific tester
+    vision_prompt = _PROMPT_TEMPLATE.format(
+        name=tester['name'],
+        biography=tester['biography'],
+        **prompt_kwargs
+    )
+
+    # Add rate limiting before API calls
+    api_rate_limiter.wait()
+    
+    # Add retries for API calls
+    retries = DEFAULT_CONFIG['max_retries']
+    while retries > 0:
+        try:
+            vision_response = chat_vision(vision_prompt, image_url_obj=image_url_obj)
+            print('vision_response', vision_response)
+            break
+        except Exception as e:
+            retries -= 1
+            if retries == 0:
+                raise
+            logger.warning(f"API call failed, retrying... ({retries} attempts left)")
+            time.sleep(2)
             
-            # Add tester's issues to results
-            all_findings.append({
-                'tester': tester['name'],
-                'biography': tester['biography'],
-                'issues': vision_response
-            })
+    print(f"AI Analysis Results from {tester['name']}:")
+    print(vision_response)
+    
+    
+    # Return tester's issues
+    return {
+        'tester': tester['name'],
+        'biography': tester['biography'],
+        'issues': vision_response
+    }
+
+DEFAULT_OUTPUT_FORMAT = 'return list of issues as an array of JSON objects with properties: title, severity, description, why_fix, how_to_fix, confidence (a number between 0 and 1)'
+
+def _prepare_check(page: SyncPage,
+                   custom_rules: Optional[Dict[str, Any]],
+                   custom_prompt: Optional[str],
+                   output: str,
+                   testers: Optional[List[str]],
+                   timeout: int,
+                   save_to_file: bool,
+                   vision_detail: str,
+                   max_text_chars: int) -> Dict[str, Any]:
+    """
+    Captures everything a check needs from the page.
+
+    Must run on the thread that owns the page; the sync Playwright API is not thread-safe.
+
+    Returns:
+        Dict with the timestamp, url, screenshot, image payload, selected testers
+        and prompt values for the check
+    """
+    # Capture screenshot in memory; it is only written to disk when saving results
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Microseconds keep names unique across parallel workers and batched checks
+    screenshot_name = f"check_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jpg"
+    screenshot_path = f"{SCREENSHOT_DIR}/{screenshot_name}" if save_to_file else None
+    screenshot_bytes = page.screenshot(type='jpeg', quality=JPEG_QUALITY, full_page=False)
+    
+    # Downscale and convert screenshot to base64 from memory
+    screenshot_base64 = _encode_screenshot(screenshot_bytes)
+    
+    # Build the image payload once; every tester shares the same screenshot
+    image_url_obj = {
+        "url": f"data:image/jpeg;base64,{screenshot_base64}",
+        "detail": vision_detail
+    }
+    
+    # Validate inputs
+    if timeout < 1000:
+        logger.warning("Timeout too low, setting to minimum 1000ms")
+        timeout = 1000
         
-        # Prepare results for saving
-        check_result = {
+    if custom_rules is not None and not isinstance(custom_rules, dict):
+        logger.error("custom_rules must be a dictionary")
+        raise ValueError("custom_rules must be a dictionary")
+
+    # Select testers - default to just Jason if no testers specified
+    testers_by_lower_name, tester_lower_names, default_tester = _get_tester_index()
+    default_testers = [default_tester] if default_tester else []
+    
+    if testers is None:
+        selected_testers = default_testers
+    else:
+        # Case-insensitive matching for tester names
+        requested_lower = [requested.lower() for requested in testers]
+        selected_testers = [
+            testers_by_lower_name[name] for name in tester_lower_names
+            if any(requested in name for requested in requested_lower)
+        ]
+        if not selected_testers:
+            logger.warning(f"No matching testers found for {testers}. Using Jason as default tester.")
+            selected_testers = default_testers
+    
+    # Get current page URL and content
+    url = page.url
+    page_text = page.locator('body').inner_text()
+    page_text = _truncate_page_text(page_text, max_text_chars)
+    
+    # Prompt values shared by every tester in this check
+    prompt_kwargs = dict(
+        url=url,
+        page_text=page_text,
+        output=output,
+        custom_prompt=custom_prompt or ''
+    )
+    
+    return {
+        'timestamp': timestamp,
+        'url': url,
+        'screenshot_path': screenshot_path,
+        'screenshot_bytes': screenshot_bytes,
+        'image_url_obj': image_url_obj,
+        'selected_testers': selected_testers,
+        'prompt_kwargs': prompt_kwargs
+    }
+
+def _submit_check(executor: ThreadPoolExecutor, prepared: Dict[str, Any]) -> List[Future]:
+    """
+    Submits the screenshot write and per-tester vision calls of a prepared check.
+
+    Returns:
+        Futures for the screenshot write (if any) followed by one per tester
+    """
+    futures = []
+    # Write the screenshot alongside the vision calls
+    if prepared['screenshot_path']:
+        os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+        futures.append(executor.submit(
+            Path(prepared['screenshot_path']).write_bytes, prepared['screenshot_bytes']
+        ))
+    for tester in prepared['selected_testers']:
+        futures.append(executor.submit(
+            _run_one_tester, tester, prepared['prompt_kwargs'], prepared['image_url_obj']
+        ))
+    return futures
+
+def _collect_findings(prepared: Dict[str, Any], futures: List[Future]) -> List[Dict[str, Any]]:
+    """Waits for a submitted check and returns the tester findings in tester order"""
+    results = [future.result() for future in futures]
+    return results[1:] if prepared['screenshot_path'] else results
+
+def _finish_check(prepared: Dict[str, Any],
+                  all_findings: List[Dict[str, Any]],
+                  profile_search: Optional[str],
+                  label: Optional[str],
+                  save_to_file: bool,
+                  output_dir: Optional[str]) -> CheckResult:
+    """Collects the issues of a check, saves the results and builds the CheckResult"""
+    timestamp = prepared['timestamp']
+    url = prepared['url']
+    screenshot_path = prepared['screenshot_path']
+    
+    # Remove screenshots older than the retention period
+    if screenshot_path:
+        _sweep_screenshots()
+    
+    # Prepare results for saving
+    check_result = {
+        'timestamp': timestamp,
+        'url': url,
+        'screenshot': screenshot_path,
+        'testers_results': all_findings
+    }
+    logger.info(f"check_result: {check_result}")
+    # Extract all issues from testers_results
+    all_issues = []
+    for tester_result in all_findings:
+        try:
+            if isinstance(tester_result['issues'], str):
+                # Parse JSON string if needed
+                issues = _json_loads(tester_result['issues'])
+            else:
+                issues = tester_result['issues']
+            all_issues.extend(issues)
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.warning(f"Error parsing issues from tester {tester_result.get('tester')}: {str(e)}")
+
+    # Only save to file if save_to_file is True
+    output_file_path = None
+    if save_to_file:
+        # Determine output file name and path
+        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = f"{label}_{timestamp_str}_ai.jsonl" if label else f"ai_checks_{timestamp_str}.jsonl"
+        output_file_path = output_file
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            output_file_path = os.path.join(output_dir, output_file)
+        
+        # Append results as one JSON Lines record instead of rewriting the file.
+        # Unbuffered, the record goes out in a single O_APPEND write; other
+        # processes may append to the same file, so the record's offset is
+        # only known once it has landed.
+        record = (_json_dumps(check_result) + '\n').encode('utf-8')
+        with open(output_file_path, 'ab', buffering=0) as f:
+            f.write(record)
+            offset = f.tell() - len(record)
+        
+        # Record a summary in the results index so reports can skip globbing
+        index_record = {
+            'file': output_file,
+            'offset': offset,
             'timestamp': timestamp,
             'url': url,
-            'screenshot': screenshot_path,
-            'testers_results': all_findings
+            'bug_count': len(all_issues)
         }
-        logger.info(f"check_result: {check_result}")
-        # Extract all issues from testers_results
-        all_issues = []
-        for tester_result in all_findings:
-            try:
-                if isinstance(tester_result['issues'], str):
-                    # Parse JSON string if needed
-                    issues = json.loads(tester_result['issues'])
-                else:
-                    issues = tester_result['issues']
-                all_issues.extend(issues)
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Error parsing issues from tester {tester_result.get('tester')}: {str(e)}")
-
-        # Only save to file if save_to_file is True
-        output_file_path = None
-        if save_to_file:
-            # Determine output file name and path
-            timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"{label}_{timestamp_str}_ai.json" if label else f"ai_checks_{timestamp_str}.json"
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-                output_file_path = os.path.join(output_dir, output_file)
-            
-            # Load existing results or create new file
-            try:
-                with open(output_file, 'r') as f:
-                    existing_results = json.load(f)
-                    if not isinstance(existing_results, list):
-                        existing_results = [existing_results]
-            except (FileNotFoundError, json.JSONDecodeError):
-                existing_results = []
-            
-            # Append new results and save
-            existing_results.append(check_result)
-            with open(output_file_path, 'w') as f:
-                json.dump(existing_results, f, indent=2)
-            
-            logger.info(f"AI check results saved to {output_file}")
+        with open(os.path.join(output_dir or '.', RESULTS_INDEX_FILE), 'a', encoding='utf-8') as f:
+            f.write(_json_dumps(index_record) + '\n')
         
-        # Continue with rest of check function...
-        if inspect.iscoroutinefunction(self.evaluate):
-            return CheckResult(
-                timestamp=datetime.now(),
-                url=url,
-                bugs=all_issues,
-                raw_response=check_result,
-                profile=profile_search or "default",
-                output_file=output_file_path  # Add the output file path
-            )
-        else:
-            return CheckResult(
-                timestamp=datetime.now(),
-                url=url,
-                bugs=all_issues,
-                raw_response=check_result,
-                profile=profile_search or "default",
-                output_file=output_file_path  # Add the output file path
-            )
+        logger.info(f"AI check results saved to {output_file_path}")
+    
+    return CheckResult(
+        timestamp=datetime.now(),
+        url=url,
+        bugs=all_issues,
+        raw_response=check_result,
+        profile=profile_search or "default",
+        output_file=output_file_path  # Add the output file path
+    )
+
+def _error_result(page: SyncPage, profile_search: Optional[str], error: Exception) -> CheckResult:
+    """Builds the CheckResult returned when a check fails"""
+    return CheckResult(
+        timestamp=datetime.now(),
+        url=page.url if hasattr(page, 'url') else "unknown",
+        bugs=[],
+        raw_response={"error": str(error)},
+        profile=profile_search or "default",
+        output_file=None
+    )
+
+def check(self, 
+          profile_search: Optional[str] = None,
+          custom_rules: Optional[Dict[str, Any]] = None,
+          custom_prompt: Optional[str] = None,
+          output: str = DEFAULT_OUTPUT_FORMAT,
+          testers: Optional[List[str]] = None,
+          label: Optional[str] = None,
+          timeout: int = 30000,
+          console_verbosity: LogLevel = LogLevel.BASIC,
+          save_to_file: bool = True,
+          output_dir: Optional[str] = "ai_check_results",
+          vision_detail: str = 'low',
+          max_text_chars: int = 4000) -> CheckResult:
+    """
+    Performs an AI-powered check of the current page.
+    
+    Args:
+        profile_search: Optional string to specify the type of check to perform
+        custom_rules: Optional dictionary of custom rules to apply
+        custom_prompt: Optional string to append to the vision analysis prompt
+        output: Format specification for the output
+        testers: Optional list of tester names to use. If None, all testers will be used
+        label: Optional label for saving results to a specific JSON file
+        timeout: Maximum time in milliseconds to wait for check completion
+        save_to_file: Whether to save results to a JSON file (default: True)
+        output_dir: Optional directory path where to save results (default: current directory)
+        vision_detail: Image detail level for the vision API ("low", "high" or "auto")
+        max_text_chars: Maximum characters of page text to include in the prompt (0 for no limit)
+        
+    Returns:
+        CheckResult object containing any issues found
+    """
+    try:
+        logger.info(f"Starting page check with profile: {profile_search}")
+        
+        prepared = _prepare_check(
+            self, custom_rules, custom_prompt, output, testers, timeout,
+            save_to_file, vision_detail, max_text_chars
+        )
+        
+        # Run analysis with each selected tester concurrently; the calls are
+        # network-bound so threads overlap the waits on the API
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(prepared['selected_testers'])))) as executor:
+            all_findings = _collect_findings(prepared, _submit_check(executor, prepared))
+        
+        return _finish_check(prepared, all_findings, profile_search, label, save_to_file, output_dir)
             
     except Exception as e:
         logger.exception(f"Critical error during page check: {str(e)}")
-        return CheckResult(
-            timestamp=datetime.now(),
-            url=self.url if hasattr(self, 'url') else "unknown",
-            bugs=[],
-            raw_response={"error": str(e)},
-            profile=profile_search or "default",
-            output_file=output_file_path  # Add the output file path
-        )
+        return _error_result(self, profile_search, e)
+
+def check_many(pages: List[SyncPage],
+               profile_search: Optional[str] = None,
+               custom_rules: Optional[Dict[str, Any]] = None,
+               custom_prompt: Optional[str] = None,
+               output: str = DEFAULT_OUTPUT_FORMAT,
+               testers: Optional[List[str]] = None,
+               label: Optional[str] = None,
+               timeout: int = 30000,
+               save_to_file: bool = True,
+               output_dir: Optional[str] = "ai_check_results",
+               vision_detail: str = 'low',
+               max_text_chars: int = 4000,
+               max_workers: int = 8) -> List[CheckResult]:
+    """
+    Performs AI-powered checks of several pages, overlapping all of their API calls.
+    
+    Each page is captured in turn on the calling thread, then the vision calls
+    for every page and tester run together on one thread pool.
+    
+    Args:
+        pages: Pages to check
+        max_workers: Maximum number of concurrent API calls
+        Other arguments are the same as for ai_check
+        
+    Returns:
+        List of CheckResult objects, one per page in the same order
+    """
+    prepared_checks = []
+    for page in pages:
+        try:
+            logger.info(f"Starting page check with profile: {profile_search}")
+            prepared_checks.append(_prepare_check(
+                page, custom_rules, custom_prompt, output, testers, timeout,
+                save_to_file, vision_detail, max_text_chars
+            ))
+        except Exception as e:
+            logger.exception(f"Critical error during page check: {str(e)}")
+            prepared_checks.append(e)
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        submitted = [
+            prepared if isinstance(prepared, Exception) else _submit_check(executor, prepared)
+            for prepared in prepared_checks
+        ]
+        for page, prepared, futures in zip(pages, prepared_checks, submitted):
+            if isinstance(prepared, Exception):
+                results.append(_error_result(page, profile_search, prepared))
+                continue
+            try:
+                all_findings = _collect_findings(prepared, futures)
+                results.append(_finish_check(prepared, all_findings, profile_search, label, save_to_file, output_dir))
+            except Exception as e:
+                logger.exception(f"Critical error during page check: {str(e)}")
+                results.append(_error_result(page, profile_search, e))
+    return results
 
 def _sync_impl(page, url, profile_search, custom_rules, page_text, screenshot):
     """Internal sync implementation"""
-    metadata = page.evaluate("""() => ({
-        title: document.title,
-        url: window.location.href,
-        viewport: {
-            width: window.innerWidth,
-            height: window.innerHeight
-        }
-    })""")
+    # url and viewport_size are tracked on the Python side, no page evaluate needed
+    metadata = {
+        "title": page.title(),
+        "url": page.url,
+        "viewport": page.viewport_size or {"width": 0, "height": 0}
+    }
     
     check_data = {
         "url": url,
@@ -529,6 +865,15 @@ check._sync_impl = _sync_impl
 # Only extend sync Page class
 setattr(SyncPage, "ai_check", check)
 
+# Markdown code fences the model sometimes wraps around JSON output
+_FENCE_RE = re.compile(r'```.*?\n|```', re.DOTALL)
+
+def _strip_code_fences(content: str) -> str:
+    """Remove markdown code fences from a model response"""
+    if '```' not in content:
+        return content
+    return _FENCE_RE.sub('', content)
+
 def getTimeStampStr():
     """Returns current timestamp as a formatted string"""
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -539,6 +884,12 @@ if not api_key:
     alert('jj')
     logger.warning("OPENAI_API_KEY environment variable not set. GPT chat functionality will not work.")
 
+# Shared HTTP session so API calls reuse pooled keep-alive connections
+# instead of paying a TCP + TLS handshake per request
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+
 def gptchat(prompt, add_time=True):
     """
     Send a prompt to GPT and get the response
@@ -583,7 +934,7 @@ def gptchat(prompt, add_time=True):
         "format": "json"
     }
 
-    response = requests.post("https://api.openai.com/v1/chat/completions", headers=headers, json=payload)
+    response = _SESSION.post(OPENAI_CHAT_URL, headers=headers, json=payload)
     
     resp = response.json()
     #print('RESP:%s' % (resp))
@@ -592,18 +943,23 @@ def gptchat(prompt, add_time=True):
     zero = choices[0]
     msg = zero['message']
     content = msg['content']
-    cleaned_content = re.sub(r'```.*?\n|```', '', content)
+    cleaned_content = _strip_code_fences(content)
     #print('cleaned_content', cleaned_content)
 
     return cleaned_content
 
-def chat_vision(prompt, base64_image, add_time=True):
-    """Enhanced error handling for vision API calls"""
+def chat_vision(prompt, base64_image=None, add_time=True, detail='low', image_url_obj=None):
+    """
+    Enhanced error handling for vision API calls
+
+    Pass image_url_obj to reuse a prebuilt image_url payload instead of
+    formatting the data URL from base64_image on every call.
+    """
     try:
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY environment variable must be set")
         
-        if not base64_image:
+        if not base64_image and not image_url_obj:
             raise ValueError("base64_image cannot be empty")
             
         if not prompt:
@@ -613,6 +969,12 @@ def chat_vision(prompt, base64_image, add_time=True):
             prompt = "Current time: %s\n%s" % (getTimeStampStr(), prompt)
         #return gptchat(prompt)
         
+        if image_url_obj is None:
+            image_url_obj = {
+                "url": f"data:image/jpeg;base64,{base64_image}",
+                "detail": detail
+            }
+        
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {api_key}"
@@ -630,9 +992,7 @@ def chat_vision(prompt, base64_image, add_time=True):
                         },
                         {
                             "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}"
-                            }
+                            "image_url": image_url_obj
                         }
                     ]
                 }
@@ -641,10 +1001,10 @@ def chat_vision(prompt, base64_image, add_time=True):
             "format": "json"
         }
 
-        response = requests.post("https://api.openai.com/v1/chat/completions", 
-                               headers=headers, 
-                               json=payload,
-                               timeout=30)  # Add timeout
+        response = _SESSION.post(OPENAI_CHAT_URL, 
+                                 headers=headers, 
+                                 json=payload,
+                                 timeout=30)  # Add timeout
         response.raise_for_status()  # Raise exception for bad status codes
         
         resp = response.json()
@@ -653,9 +1013,9 @@ def chat_vision(prompt, base64_image, add_time=True):
         zero = choices[0]
         msg = zero['message']
         content = msg['content']
-        cleaned_content = re.sub(r'```.*?\n|```', '', content)
+        cleaned_content = _strip_code_fences(content)
         #print('cleaned_content', cleaned_content)
-        ret = json.loads(cleaned_content)
+        ret = _json_loads(cleaned_content)
 
         return ret
         
@@ -666,12 +1026,75 @@ def chat_vision(prompt, base64_image, add_time=True):
         logger.exception(f"Error in chat_vision: {str(e)}")
         return "[]"  # Return empty JSON array as fallback
 
-def ai_report(self, output_dir: str = "ai_check_results") -> str:
+def _scan_files(directory: str) -> Dict[str, str]:
+    """Map file names to paths for the entries of a directory (empty if missing)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.path for entry in entries}
+    except FileNotFoundError:
+        return {}
+
+def _publish_screenshot(src: str, dst: str) -> None:
+    """
+    Make a screenshot available in the reports directory without copying bytes.
+
+    Tries a hardlink first, then a symlink, and only copies as a last resort.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        try:
+            os.symlink(os.path.abspath(src), dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+def _load_indexed_results(output_dir: str, index_path: str,
+                          max_results: Optional[int] = None):
+    """
+    Load check results listed in the results index.
+
+    Each index row points at the byte offset of one record in a JSON Lines
+    result file, so only the rows being rendered are read and parsed.
+
+    Args:
+        output_dir: Directory containing the result files
+        index_path: Path to the index file
+        max_results: Optional limit to the most recent results
+
+    Returns:
+        The loaded results, and the names of every file the index covers
+    """
+    with open(index_path, 'r', encoding='utf-8') as f:
+        rows = [_json_loads(line) for line in f if line.strip()]
+    indexed_files = {row.get('file') for row in rows}
+    if max_results:
+        rows = rows[-max_results:]
+    
+    results = []
+    open_files = {}
+    try:
+        for row in rows:
+            try:
+                result_file = open_files.get(row['file'])
+                if result_file is None:
+                    result_file = open(os.path.join(output_dir, row['file']), 'rb')
+                    open_files[row['file']] = result_file
+                result_file.seek(row['offset'])
+                results.append(_json_loads(result_file.readline()))
+            except Exception as e:
+                logger.warning(f"Error reading indexed result {row.get('file')}: {str(e)}")
+    finally:
+        for result_file in open_files.values():
+            result_file.close()
+    return results, indexed_files
+
+def ai_report(self, output_dir: str = "ai_check_results", max_results: Optional[int] = None) -> str:
     """
     Generate an HTML report from AI check results (sync version)
     
     Args:
         output_dir: Directory containing JSON result files (default: "ai_check_results")
+        max_results: Optional limit to the most recent indexed results
         
     Returns:
         Path to the generated HTML report
@@ -683,15 +1106,26 @@ def ai_report(self, output_dir: str = "ai_check_results") -> str:
         reports_dir = os.path.join(output_dir, "reports")
         os.makedirs(reports_dir, exist_ok=True)
         
-        # Find all JSON files in the output directory
+        # Find all result files in the output directory; JSON Lines results
+        # are read through the index when one exists
+        index_path = os.path.join(output_dir, RESULTS_INDEX_FILE)
         json_files = glob.glob(os.path.join(output_dir, "ai_*.json"))
+        jsonl_files = (glob.glob(os.path.join(output_dir, "ai_checks_*.jsonl")) +
+                       glob.glob(os.path.join(output_dir, "*_ai.jsonl")))
         
         # Collect all results
         all_results = []
+        if os.path.exists(index_path):
+            indexed_results, indexed_files = _load_indexed_results(output_dir, index_path, max_results)
+            all_results.extend(indexed_results)
+            # Files the index does not list, e.g. written before it existed
+            # or copied in from another run, are still read in full below
+            jsonl_files = [path for path in jsonl_files
+                           if os.path.basename(path) not in indexed_files]
         for json_file in json_files:
             try:
-                with open(json_file, 'r') as f:
-                    results = json.load(f)
+                with open(json_file, 'rb') as f:
+                    results = _json_loads(f.read())
                     if isinstance(results, list):
                         all_results.extend(results)
                     else:
@@ -699,23 +1133,33 @@ def ai_report(self, output_dir: str = "ai_check_results") -> str:
             except Exception as e:
                 logger.warning(f"Error reading {json_file}: {str(e)}")
         
-        # Get template from package directory
-        package_dir = os.path.dirname(os.path.abspath(__file__))
-        template_path = os.path.join(package_dir, 'report_template.html')
+        # JSON Lines files hold one check result per line
+        for jsonl_file in jsonl_files:
+            try:
+                with open(jsonl_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            all_results.append(_json_loads(line))
+            except Exception as e:
+                logger.warning(f"Error reading {jsonl_file}: {str(e)}")
         
-        # Copy screenshots to reports directory
+        # Publish screenshots to reports directory; list both directories once
+        # instead of checking every result's files individually
+        available = _scan_files(SCREENSHOT_DIR)
+        published = set(_scan_files(reports_dir))
         for result in all_results:
-            if 'screenshot' in result:
-                screenshot_path = result['screenshot']
-                if os.path.exists(screenshot_path):
-                    dest_path = os.path.join(reports_dir, os.path.basename(screenshot_path))
-                    shutil.copy2(screenshot_path, dest_path)
+            if result.get('screenshot'):
+                name = os.path.basename(result['screenshot'])
+                src = available.get(name)
+                if src:
+                    if name not in published:
+                        _publish_screenshot(src, os.path.join(reports_dir, name))
+                        published.add(name)
                     # Update path in result to be relative
-                    result['screenshot'] = os.path.join('reports', os.path.basename(screenshot_path))
+                    result['screenshot'] = os.path.join('reports', name)
         
         # Generate report
-        with open(template_path, 'r') as f:
-            template = Template(f.read())
+        template = _jinja_env.get_template('report_template.html')
             
         report_html = template.render(
             results=all_results,
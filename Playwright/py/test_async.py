@@ -11,6 +11,14 @@ How to run these tests:
 2. With verbose output:
    python -m unittest -v test.py
 
+3. In parallel with pytest-xdist (pip install pytest pytest-xdist):
+   pytest -n auto --dist=load test_async.py
+
+   Each worker process launches its own browser, so tests spread across
+   workers instead of running one after another.
+
+The browser runs headless by default; set HEADED=1 to watch it.
+
 Requirements:
 - playwright >= 1.41.0
 - playwright-cotestpilot >= 0.1.0
@@ -24,56 +32,167 @@ https://github.com/your-repo/playwright-cotestpilot
 
 import unittest
 import asyncio
+import functools
 from unittest import skipIf
 from playwright.async_api import async_playwright
-import time
 import playwright_async_cotestpilot
 import json
 import os
+from pathlib import Path
+from urllib.parse import urlparse
+from test_common import (
+    HEADLESS, BROWSER_ARGS, GOOGLE_URL, SEARCH_BOX, STORAGE_STATE, CACHE_ENABLED,
+    CheckAssertions, cache_key, configure_logging, is_blocked, json_loads, list_dir,
+    load_cached_result, store_cached_result, write_storage_state,
+)
 import logging
 
 # Add logging configuration
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
+
+async def cached_ai_check(page, **kwargs):
+    """Run page.ai_check, reusing a cached result for the same page and params"""
+    if not CACHE_ENABLED:
+        return await page.ai_check(**kwargs)
+    key = cache_key(playwright_async_cotestpilot, page.url, await page.locator('body').inner_text(), kwargs)
+    try:
+        return load_cached_result(key)
+    except FileNotFoundError:
+        pass
+    result = await page.ai_check(**kwargs)
+    store_cached_result(key, result)
+    return result
+
+async def wait_for_output_file(path, timeout=3.0):
+    """Poll until path exists and is non-empty, giving up after timeout seconds"""
+    async def _poll():
+        while not (os.path.exists(path) and os.path.getsize(path) > 0):
+            await asyncio.sleep(0.05)
+    try:
+        await asyncio.wait_for(_poll(), timeout)
+    except asyncio.TimeoutError:
+        # Leave it to the test's own assertions to report the missing file
+        pass
+
+async def block_third_party(route):
+    """Route handler that aborts third-party images, fonts and media"""
+    if is_blocked(route.request, urlparse(route.request.url).hostname or ''):
+        await route.abort()
+    else:
+        await route.continue_()
+
+def load_json_file(path):
+    """Read a results file in one call and parse it"""
+    return json_loads(Path(path).read_bytes())
+
+def async_test(test):
+    """Run an async test method to completion on its class's event loop"""
+    @functools.wraps(test)
+    def wrapper(self):
+        return self._loop.run_until_complete(test(self))
+    return wrapper
+
+class TestGoogleNavigation(CheckAssertions, unittest.TestCase):
+    CHECK_SEVERITY_LABELS = True
+
+    # Playwright objects are bound to the event loop that created them, so the
+    # class owns one loop and runs its setup, teardown and every test on it.
+    # IsolatedAsyncioTestCase would give each test a fresh loop instead.
 
-class TestGoogleNavigation(unittest.IsolatedAsyncioTestCase):  # Changed base class
-    async def asyncSetUp(self):  # Changed to async setup
-        """Set up test environment before each test"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=False)
-        self.context = await self.browser.new_context()
+    @classmethod
+    def setUpClass(cls):
+        """Launch one browser shared by all tests in the class"""
+        cls._loop = asyncio.new_event_loop()
+        cls._loop.run_until_complete(cls.asyncSetUpClass())
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared browser once after all tests"""
+        try:
+            cls._loop.run_until_complete(cls.asyncTearDownClass())
+        finally:
+            cls._loop.close()
+
+    @classmethod
+    async def asyncSetUpClass(cls):
+        cls.playwright = await async_playwright().start()
+        cls.browser = await cls.playwright.chromium.launch(
+            headless=HEADLESS,
+            args=BROWSER_ARGS
+        )
+        await cls.save_storage_state()
+        cls._baseline_result = None
+
+    @classmethod
+    async def save_storage_state(cls):
+        """Visit Google once, accept consent if asked, and save the storage state"""
+        if os.path.exists(STORAGE_STATE):
+            return
+        context = await cls.browser.new_context()
+        try:
+            page = await context.new_page()
+            await page.goto(GOOGLE_URL, wait_until='domcontentloaded')
+            consent = page.locator('button:has-text("Accept all")')
+            if await consent.count():
+                await consent.first.click()
+            write_storage_state(await context.storage_state())
+        finally:
+            await context.close()
+
+    @classmethod
+    async def asyncTearDownClass(cls):
+        await cls.browser.close()
+        await cls.playwright.stop()
+
+    def setUp(self):
+        self._loop.run_until_complete(self.asyncSetUp())
+
+    def tearDown(self):
+        self._loop.run_until_complete(self.asyncTearDown())
+
+    async def asyncSetUp(self):
+        """Give each test a fresh context and page"""
+        self.context = await self.browser.new_context(storage_state=STORAGE_STATE)
+        await self.context.route('**/*', block_third_party)
         self.page = await self.context.new_page()
 
-    async def asyncTearDown(self):  # Changed to async teardown
+    async def asyncTearDown(self):
         """Clean up after each test"""
         await self.context.close()
-        await self.browser.close()
-        await self.playwright.stop()
 
-    async def test_google_navigation(self):  # Made test async
+    async def goto_google(self):
+        """Open Google and wait for the search box rather than network idle"""
+        await self.page.goto(GOOGLE_URL, wait_until='domcontentloaded')
+        await self.page.wait_for_selector(SEARCH_BOX, state='visible')
+
+    async def baseline_result(self):
+        """Default ai_check of Google, fetched once and shared by structural tests"""
+        cls = type(self)
+        if cls._baseline_result is None:
+            await self.goto_google()
+            cls._baseline_result = await cached_ai_check(self.page)
+        return cls._baseline_result
+
+    @async_test
+    async def test_google_navigation(self):
         """Test navigation to Google homepage"""
         try:
             logger.info("Navigating to Google...")
-            await self.page.goto('https://www.google.com')
-            await self.page.wait_for_load_state('networkidle')
+            await self.goto_google()
             
-            result =  await self.page.ai_check()
+            result =  await cached_ai_check(self.page)
             
         except Exception as e:
             logger.error(f"Test failed: {str(e)}")
             raise
-        
-        await asyncio.sleep(1)
 
-    async def test_ai_check_with_testers(self):  # Made test async
+    @async_test
+    async def test_ai_check_with_testers(self):
         """Test AI checks with specific testing personas"""
-        await self.page.goto('https://www.google.com')
-        await self.page.wait_for_load_state('networkidle')
+        await self.goto_google()
         
-        result = await self.page.ai_check(
+        result = await cached_ai_check(self.page,
             testers=['Jason', 'Alice'],
             label='google_homepage'
         )
@@ -82,15 +201,13 @@ class TestGoogleNavigation(unittest.IsolatedAsyncioTestCase):  # Changed base cl
         self.assertTrue(hasattr(result, 'raw_response'))
         self.assertTrue(hasattr(result, 'profile'))
         self.assertEqual(result.profile, 'default')
-        
-        await asyncio.sleep(1)
 
-    async def test_ai_check_with_custom_rules(self):  # Made test async
+    @async_test
+    async def test_ai_check_with_custom_rules(self):
         """Test AI checks with custom accessibility rules"""
-        await self.page.goto('https://www.google.com')
-        await self.page.wait_for_load_state('networkidle')
+        await self.goto_google()
         
-        result = await self.page.ai_check(
+        result = await cached_ai_check(self.page,
             custom_rules={
                 'check_contrast': True,
                 'min_font_size': 12
@@ -100,62 +217,20 @@ class TestGoogleNavigation(unittest.IsolatedAsyncioTestCase):  # Changed base cl
         
         self.assertTrue(hasattr(result, 'raw_response'))
         self.assertIsInstance(result.raw_response, dict)
-        
-        await asyncio.sleep(2)
 
-    async def test_check_result_structure(self):  # Made test async
+    @async_test
+    async def test_check_result_structure(self):
         """Test the basic structure of CheckResult object"""
-        await self.page.goto('https://www.google.com')
-        await self.page.wait_for_load_state('networkidle')
-        
-        result = await self.page.ai_check()
-        
-        # Verify all required attributes are present
-        required_fields = ['timestamp', 'url', 'bugs', 'raw_response', 'profile']
-        for field in required_fields:
-            self.assertTrue(hasattr(result, field), f"Missing field: {field}")
-        
-        # Verify timestamp is a datetime object
-        from datetime import datetime
-        self.assertIsInstance(result.timestamp, datetime)
-        
-        # Verify URL matches
-        self.assertEqual(result.url, 'https://www.google.com/')
+        result = await self.baseline_result()
+        self.assertCheckResultStructure(result)
 
-    async def test_bug_report_format(self):  # Made test async
+    @async_test
+    async def test_bug_report_format(self):
         """Test the structure of individual bug reports"""
-        await self.page.goto('https://www.google.com')
-        await self.page.wait_for_load_state('networkidle')
-        
-        result = await self.page.ai_check()
-        
-        # Check if bugs is a list
-        self.assertIsInstance(result.bugs, list)
-        
-        # If any bugs are found, verify their structure
-        if result.bugs:
-            bug = result.bugs[0]  # Test first bug
-            required_bug_fields = [
-                'title',
-                'severity',
-                'description',
-                'why_fix',
-                'how_to_fix',
-                'confidence'
-            ]
-            
-            # Assuming bug is a dictionary
-            for field in required_bug_fields:
-                self.assertIn(field, bug)
-            
-            # Verify severity is valid
-            self.assertIn(bug['severity'], ['high', 'medium', 'low'])
-            
-            # Verify confidence is a float between 0 and 1
-            self.assertIsInstance(bug['confidence'], float)
-            self.assertGreaterEqual(bug['confidence'], 0)
-            self.assertLessEqual(bug['confidence'], 1)
+        result = await self.baseline_result()
+        self.assertBugReportFormat(result)
 
+    @async_test
     async def test_json_output_file(self):
         """Test that results are properly saved to JSON file"""
         test_label = 'test_output'
@@ -164,8 +239,7 @@ class TestGoogleNavigation(unittest.IsolatedAsyncioTestCase):  # Changed base cl
         # Create test_results directory if it doesn't exist
         os.makedirs(test_dir, exist_ok=True)
         
-        await self.page.goto('https://www.google.com')
-        await self.page.wait_for_load_state('networkidle')
+        await self.goto_google()
         
         # Perform the AI check
         result = await self.page.ai_check(
@@ -181,38 +255,33 @@ class TestGoogleNavigation(unittest.IsolatedAsyncioTestCase):  # Changed base cl
         # Log the result object
         logger.info(f"Result output_file: {getattr(result, 'output_file', 'No output_file attribute')}")
         
-        # Add a longer delay to ensure file writing is complete
-        await asyncio.sleep(3)
+        # Wait until the file is written rather than sleeping a fixed time
+        await wait_for_output_file(result.output_file)
         
-        # Log directory contents after
-        logger.info(f"Directory contents after: {os.listdir(test_dir) if os.path.exists(test_dir) else 'directory not found'}")
+        # List the directory once and reuse it for logging and the existence check
+        entries = list_dir(test_dir)
+        logger.info(f"Directory contents after: {entries if entries is not None else 'directory not found'}")
         
         # Check if file exists and log result
-        file_exists = os.path.exists(result.output_file)
+        file_exists = os.path.basename(result.output_file) in (entries or [])
         logger.info(f"File exists at {result.output_file}: {file_exists}")
         
         if not file_exists:
             # List all files in directory that contain 'test_output'
-            matching_files = [f for f in os.listdir(test_dir) if 'test_output' in f]
+            matching_files = [f for f in entries or [] if 'test_output' in f]
             logger.info(f"Found files matching 'test_output': {matching_files}")
         
         # Verify JSON file exists and has basic structure
         self.assertTrue(file_exists, f"File not found at {result.output_file}")
         
-        with open(result.output_file, 'r') as f:
-            saved_results = json.load(f)
+        saved_results = load_json_file(result.output_file)
         
-        # Basic structure checks
-        self.assertIsInstance(saved_results, list)
-        self.assertGreater(len(saved_results), 0)
-        self.assertIn('timestamp', saved_results[0])
-        self.assertIn('url', saved_results[0])
-        self.assertIn('testers_results', saved_results[0])
+        self.assertSavedResults(saved_results)
 
+    @async_test
     async def test_forced_issues_for_testing(self):
         """Test AI checks with a prompt that forces issue generation for testing"""
-        await self.page.goto('https://www.google.com')
-        await self.page.wait_for_load_state('networkidle')
+        await self.goto_google()
         
         result = await self.page.ai_check(
             custom_prompt="""
@@ -222,21 +291,18 @@ class TestGoogleNavigation(unittest.IsolatedAsyncioTestCase):  # Changed base cl
             """
         )
         
-        # Add delay to ensure file writing is complete
-        await asyncio.sleep(0.5)
+        # Wait until the file is written rather than sleeping a fixed time
+        await wait_for_output_file(result.output_file)
         
         # Load and validate output file
         results = None
         try:
             logger.info(f"Attempting to read results from {result.output_file}")
             
-            if not os.path.exists(result.output_file):
-                raise FileNotFoundError(f"Output file not found at: {result.output_file}")
-                
-            with open(result.output_file, 'r', encoding='utf-8') as f:
-                results = json.load(f)
-                logger.info(f"Successfully loaded JSON data from {result.output_file}")
-                logger.debug(f"Raw results: {json.dumps(results, indent=2)}")
+            # read_bytes raises FileNotFoundError itself if the file is missing
+            results = load_json_file(result.output_file)
+            logger.info(f"Successfully loaded JSON data from {result.output_file}")
+            logger.debug(f"Raw results: {json.dumps(results, indent=2)}")
                 
         except FileNotFoundError as e:
             logger.error(f"File not found error: {str(e)}")
@@ -261,20 +327,52 @@ class TestGoogleNavigation(unittest.IsolatedAsyncioTestCase):  # Changed base cl
         except AssertionError as e:
             logger.error(f"Validation failed: {str(e)}")
             raise
-            
-        await asyncio.sleep(1)
 
+    @async_test
+    async def test_concurrent_ai_checks(self):
+        """Test several AI checks fanned out over parallel contexts"""
+        variants = [
+            {'testers': ['Jason']},
+            {'testers': ['Alice'], 'label': 'google_homepage'},
+            {'custom_prompt': "Pay special attention to accessibility issues"},
+        ]
+
+        # One context per check, all sharing the class browser
+        contexts = await asyncio.gather(*[
+            self.browser.new_context(storage_state=STORAGE_STATE) for _ in variants
+        ])
+        try:
+            await asyncio.gather(*[c.route('**/*', block_third_party) for c in contexts])
+            pages = await asyncio.gather(*[c.new_page() for c in contexts])
+            # Same wait as goto_google, so each check sees a rendered page
+            await asyncio.gather(*[
+                p.goto(GOOGLE_URL, wait_until='domcontentloaded') for p in pages
+            ])
+            await asyncio.gather(*[
+                p.wait_for_selector(SEARCH_BOX, state='visible') for p in pages
+            ])
+
+            results = await asyncio.gather(*[
+                cached_ai_check(p, **variant) for p, variant in zip(pages, variants)
+            ])
+        finally:
+            await asyncio.gather(*[c.close() for c in contexts])
+
+        self.assertEqual(len(results), len(variants))
+        for result in results:
+            self.assertTrue(hasattr(result, 'raw_response'))
+            self.assertIsInstance(result.bugs, list)
+
+    @async_test
     async def test_report_generation(self):
         """Test that AI check report generation works correctly"""
-        await self.page.goto('https://www.google.com')
-        await self.page.wait_for_load_state('networkidle')
+        await self.goto_google()
         
         # Perform AI check and generate repor
         report_gen = await self.page.ai_report()
-        await asyncio.sleep(1)
 
 if __name__ == '__main__':
     # Create and run test suite
     suite = unittest.TestLoader().loadTestsFromTestCase(TestGoogleNavigation)
     runner = unittest.TextTestRunner()
-    asyncio.run(runner.run(suite))
\ No newline at end of file
+    runner.run(suite)
\ No newline at end of file
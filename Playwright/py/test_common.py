@@ -0,0 +1,176 @@
+"""
+Shared pieces of the Playwright AI Testing Suites
+=================================================
+
+test_sync.py and test_async.py cover the sync and async packages with the
+same flows. The settings, result cache and assertions they share live here
+so a change only has to be made once.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import time
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def configure_logging():
+    """Set up root logging once, however many test modules import this"""
+    if not logging.getLogger().hasHandlers():
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+
+# Run headless unless HEADED=1 is set, e.g. to watch tests locally
+HEADLESS = os.environ.get('HEADED') != '1'
+BROWSER_ARGS = [
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+]
+
+GOOGLE_URL = 'https://www.google.com'
+SEARCH_BOX = 'textarea[name="q"]'
+
+# Cookies and consent choices saved after the first Google visit, reused by
+# every later context so tests skip the first-visit consent flow
+STORAGE_STATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'google_state.json')
+
+def write_storage_state(state):
+    """Save a storage state so no parallel worker can read a half-written file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(STORAGE_STATE), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, STORAGE_STATE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+# Third-party resources of these types are aborted; they slow page loads and
+# add nothing to the checks. Google's own hosts stay allowed so screenshots
+# still show the real page.
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'other'}
+FIRST_PARTY_HOSTS = ('google.com', 'gstatic.com')
+
+# On-disk cache of ai_check results so repeat runs skip identical LLM calls.
+# Set COTESTPILOT_TEST_CACHE=0 to always call the model.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'cotestpilot')
+CACHE_ENABLED = os.environ.get('COTESTPILOT_TEST_CACHE', '1') != '0'
+# Seconds a cached result stays valid, matching the Selenium suite's cache
+CACHE_TTL = 3600
+
+@functools.lru_cache(maxsize=128)
+def _load_pickle(path, mtime_ns):
+    # mtime_ns is part of the cache key, so a rewritten file is loaded again
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+def load_cached_result(key):
+    """Load a cached CheckResult, raising FileNotFoundError on a miss or expired entry"""
+    path = os.path.join(CACHE_DIR, f"{key}.pkl")
+    st = os.stat(path)
+    if time.time() - st.st_mtime > CACHE_TTL:
+        raise FileNotFoundError(path)
+    return _load_pickle(path, st.st_mtime_ns)
+
+def store_cached_result(key, result):
+    # A failed check is not worth replaying; the next run should retry it
+    if 'error' in (getattr(result, 'raw_response', None) or {}):
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(os.path.join(CACHE_DIR, f"{key}.pkl"), 'wb') as f:
+        pickle.dump(result, f)
+
+def cache_key(package, url, page_text, params):
+    """
+    Key a check on the package that ran it, the page and the check params.
+
+    The package's name and source mtime are part of the key, so the sync and
+    async suites never share entries and a changed package invalidates them.
+    """
+    # Key on the visible text rather than raw HTML, which carries per-load nonces
+    page_text = ' '.join(page_text.split())
+    version = f"{package.__name__}@{os.path.getmtime(package.__file__)}"
+    payload = version + '\n' + url + '\n' + page_text + '\n' + json.dumps(params, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def is_blocked(request, hostname):
+    """Whether a request should be aborted by the test contexts' route handler"""
+    return (request.resource_type in BLOCKED_RESOURCE_TYPES
+            and not any(hostname == domain or hostname.endswith('.' + domain)
+                        for domain in FIRST_PARTY_HOSTS))
+
+def list_dir(path):
+    """Return the entry names in path from one scandir pass, or None if missing"""
+    try:
+        with os.scandir(path) as it:
+            return [entry.name for entry in it]
+    except FileNotFoundError:
+        return None
+
+def json_loads(data):
+    """Parse JSON bytes, using orjson when installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+REQUIRED_FIELDS = frozenset({'timestamp', 'url', 'bugs', 'raw_response', 'profile'})
+REQUIRED_BUG_FIELDS = frozenset({
+    'title', 'severity', 'description', 'why_fix', 'how_to_fix', 'confidence'
+})
+
+class CheckAssertions:
+    """Assertions shared by the sync and async TestCase classes"""
+
+    # Only the async suite has always pinned severity to high/medium/low
+    CHECK_SEVERITY_LABELS = False
+
+    def assertCheckResultStructure(self, result):
+        # Verify all required attributes are present
+        missing = REQUIRED_FIELDS - set(vars(result))
+        self.assertFalse(missing, f"Missing fields: {sorted(missing)}")
+
+        # Verify timestamp is a datetime object
+        self.assertIsInstance(result.timestamp, datetime)
+
+        # Verify URL matches
+        self.assertEqual(result.url, GOOGLE_URL + '/')
+
+    def assertBugReportFormat(self, result):
+        # Check if bugs is a list
+        self.assertIsInstance(result.bugs, list)
+
+        # If any bugs are found, verify their structure
+        if result.bugs:
+            bug = result.bugs[0]  # Test first bug
+
+            # Assuming bug is a dictionary
+            missing = REQUIRED_BUG_FIELDS - bug.keys()
+            self.assertFalse(missing, f"Missing bug fields: {sorted(missing)}")
+
+            # Verify severity is valid
+            if self.CHECK_SEVERITY_LABELS:
+                self.assertIn(bug['severity'], ['high', 'medium', 'low'])
+
+            # Verify confidence is a float between 0 and 1
+            self.assertIsInstance(bug['confidence'], float)
+            self.assertGreaterEqual(bug['confidence'], 0)
+            self.assertLessEqual(bug['confidence'], 1)
+
+    def assertSavedResults(self, saved_results):
+        # Basic structure checks
+        self.assertIsInstance(saved_results, list)
+        self.assertGreater(len(saved_results), 0)
+        self.assertIn('timestamp', saved_results[0])
+        self.assertIn('url', saved_results[0])
+        self.assertIn('testers_results', saved_results[0])
@@ -11,6 +11,14 @@ How to run these tests:
 2. With verbose output:
    python -m unittest -v test.py
 
+3. In parallel with pytest-xdist (pip install pytest pytest-xdist):
+   pytest -n auto --dist=load test_sync.py
+
+   Each worker process launches its own browser, so tests spread across
+   workers instead of running one after another.
+
+The browser runs headless by default; set HEADED=1 to watch it.
+
 Requirements:
 - playwright >= 1.41.0
 - playwright-cotestpilot >= 0.1.0
@@ -25,56 +33,119 @@ https://github.com/your-repo/playwright-cotestpilot
 import unittest
 from unittest import skipIf
 from playwright.sync_api import sync_playwright
-import time
 import playwright_sync_cotestpilot  # import checks
-import json
 import os
+import json
+import tempfile
+from urllib.parse import urlparse
+from test_common import (
+    HEADLESS, BROWSER_ARGS, GOOGLE_URL, SEARCH_BOX, STORAGE_STATE, CACHE_ENABLED,
+    CheckAssertions, cache_key, configure_logging, is_blocked, json_loads, list_dir,
+    load_cached_result, store_cached_result, write_storage_state,
+)
 import logging  # Add this import
 
 # Add logging configuration
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
+
+def cached_ai_check(page, **kwargs):
+    """Run page.ai_check, reusing a cached result for the same page and params"""
+    if not CACHE_ENABLED:
+        return page.ai_check(**kwargs)
+    key = cache_key(playwright_sync_cotestpilot, page.url, page.locator('body').inner_text(), kwargs)
+    try:
+        return load_cached_result(key)
+    except FileNotFoundError:
+        pass
+    result = page.ai_check(**kwargs)
+    store_cached_result(key, result)
+    return result
+
+def block_third_party(route):
+    """Route handler that aborts third-party images, fonts and media"""
+    if is_blocked(route.request, urlparse(route.request.url).hostname or ''):
+        route.abort()
+    else:
+        route.continue_()
+
+class TestGoogleNavigation(CheckAssertions, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Launch one browser shared by all tests in the class"""
+        cls.playwright = sync_playwright().start()
+        cls.browser = cls.playwright.chromium.launch(
+            headless=HEADLESS,
+            args=BROWSER_ARGS
+        )
+        cls.save_storage_state()
+        cls._baseline_result = None
+
+    @classmethod
+    def save_storage_state(cls):
+        """Visit Google once, accept consent if asked, and save the storage state"""
+        if os.path.exists(STORAGE_STATE):
+            return
+        context = cls.browser.new_context()
+        try:
+            page = context.new_page()
+            page.goto(GOOGLE_URL, wait_until='domcontentloaded')
+            consent = page.locator('button:has-text("Accept all")')
+            if consent.count():
+                consent.first.click()
+            write_storage_state(context.storage_state())
+        finally:
+            context.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared browser once after all tests"""
+        cls.browser.close()
+        cls.playwright.stop()
 
-class TestGoogleNavigation(unittest.TestCase):
     def setUp(self):
-        """Set up test environment before each test"""
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=False)
-        self.context = self.browser.new_context()
+        """Give each test a fresh context and page"""
+        self.context = self.browser.new_context(storage_state=STORAGE_STATE)
+        self.context.route('**/*', block_third_party)
         self.page = self.context.new_page()
 
     def tearDown(self):
         """Clean up after each test"""
         self.context.close()
-        self.browser.close()
-        self.playwright.stop()
+
+    def goto_google(self):
+        """Open Google and wait for the search box rather than network idle"""
+        self.page.goto(GOOGLE_URL, wait_until='domcontentloaded')
+        self.page.wait_for_selector(SEARCH_BOX, state='visible')
+
+    def baseline_result(self):
+        """Default ai_check of Google, fetched once and shared by structural tests"""
+        cls = type(self)
+        if cls._baseline_result is None:
+            self.goto_google()
+            cls._baseline_result = cached_ai_check(self.page)
+        return cls._baseline_result
 
     def test_google_navigation(self):
         """Test navigation to Google homepage"""
         try:
             logger.info("Navigating to Google...")
-            self.page.goto('https://www.google.com')
-            
-            self.page.wait_for_load_state('networkidle')
-            result = self.page.ai_check()
+            self.goto_google()
+            result = cached_ai_check(self.page)
             
-            logger.info(f"Successfully loaded Google! Page title: {self.page.title()}")
+            # page.title() is a browser round-trip, so only fetch it when it is logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Successfully loaded Google! Page title: {self.page.title()}")
             
         except Exception as e:
             logger.error(f"Test failed: {str(e)}")
             raise
-        
-        time.sleep(1)
 
     def test_ai_check_with_testers(self):
         """Test AI checks with specific testing personas"""
-        self.page.goto('https://www.google.com')
-        self.page.wait_for_load_state('networkidle')
+        self.goto_google()
         
-        result = self.page.ai_check(
+        result = cached_ai_check(self.page,
             testers=['Jason', 'Alice'],
             label='google_homepage'
         )
@@ -83,15 +154,12 @@ class TestGoogleNavigation(unittest.TestCase):
         self.assertTrue(hasattr(result, 'raw_response'))
         self.assertTrue(hasattr(result, 'profile'))
         self.assertEqual(result.profile, 'default')  # Assuming default profile
-        
-        time.sleep(1)
 
     def test_ai_check_with_custom_rules(self):
         """Test AI checks with custom accessibility rules"""
-        self.page.goto('https://www.google.com')
-        self.page.wait_for_load_state('networkidle')
+        self.goto_google()
         
-        result = self.page.ai_check(
+        result = cached_ai_check(self.page,
             custom_rules={
                 'check_contrast': True,
                 'min_font_size': 12
@@ -102,59 +170,16 @@ class TestGoogleNavigation(unittest.TestCase):
         # Verify the result contains basic structure instead of custom_rules
         self.assertTrue(hasattr(result, 'raw_response'))
         self.assertIsInstance(result.raw_response, dict)
-        
-        time.sleep(1)
 
     def test_check_result_structure(self):
         """Test the basic structure of CheckResult object"""
-        self.page.goto('https://www.google.com')
-        self.page.wait_for_load_state('networkidle')
-        
-        result = self.page.ai_check()
-        
-        # Verify all required attributes are present
-        required_fields = ['timestamp', 'url', 'bugs', 'raw_response', 'profile']
-        for field in required_fields:
-            self.assertTrue(hasattr(result, field), f"Missing field: {field}")
-        
-        # Verify timestamp is a datetime object
-        from datetime import datetime
-        self.assertIsInstance(result.timestamp, datetime)
-        
-        # Verify URL matches
-        self.assertEqual(result.url, 'https://www.google.com/')
+        result = self.baseline_result()
+        self.assertCheckResultStructure(result)
 
     def test_bug_report_format(self):
         """Test the structure of individual bug reports"""
-        self.page.goto('https://www.google.com')
-        self.page.wait_for_load_state('networkidle')
-        
-        result = self.page.ai_check()
-        
-        # Check if bugs is a list
-        self.assertIsInstance(result.bugs, list)
-        
-        # If any bugs are found, verify their structure
-        if result.bugs:
-            bug = result.bugs[0]  # Test first bug
-            required_bug_fields = [
-                'title',
-                'severity',
-                'description',
-                'why_fix',
-                'how_to_fix',
-                'confidence'
-            ]
-            
-            # Assuming bug is a dictionary
-            for field in required_bug_fields:
-                self.assertIn(field, bug)
-            
-            
-            # Verify confidence is a float between 0 and 1
-            self.assertIsInstance(bug['confidence'], float)
-            self.assertGreaterEqual(bug['confidence'], 0)
-            self.assertLessEqual(bug['confidence'], 1)
+        result = self.baseline_result()
+        self.assertBugReportFormat(result)
 
     def test_json_output_file(self):
         """Test that results are properly saved to JSON file"""
@@ -167,8 +192,7 @@ class TestGoogleNavigation(unittest.TestCase):
         logger.info(f"Expected JSON path: {json_path}")
         
         # Navigate to the page first
-        self.page.goto('https://www.google.com')
-        self.page.wait_for_load_state('networkidle')
+        self.goto_google()
 
         result = self.page.ai_check(
             custom_prompt="""
@@ -178,26 +202,24 @@ class TestGoogleNavigation(unittest.TestCase):
             """
         )
         # List directory contents for debugging
-        logger.info(f"Contents of {test_dir}: {os.listdir(test_dir) if os.path.exists(test_dir) else 'directory not found'}")
+        entries = list_dir(test_dir)
+        logger.info(f"Contents of {test_dir}: {entries if entries is not None else 'directory not found'}")
         
         # Verify JSON file exists and has basic structure
         self.assertTrue(os.path.exists(result.output_file), f"File not found at {result.output_file}")
         
-        with open(result.output_file, 'r') as f:
-            saved_results = json.load(f)
+        # The structural checks only look at the first record, so stop reading
+        # the JSONL file after its first non-empty line
+        with open(result.output_file, 'rb') as f:
+            first = next((line for line in f if line.strip()), None)
+        saved_results = [json_loads(first)] if first else []
         
-        # Basic structure checks
-        self.assertIsInstance(saved_results, list)
-        self.assertGreater(len(saved_results), 0)
-        self.assertIn('timestamp', saved_results[0])
-        self.assertIn('url', saved_results[0])
-        self.assertIn('testers_results', saved_results[0])
+        self.assertSavedResults(saved_results)
         
 
     def test_forced_issues_for_testing(self):
         """Test AI checks with a prompt that forces issue generation for testing"""
-        self.page.goto('https://www.google.com')
-        self.page.wait_for_load_state('networkidle')
+        self.goto_google()
         
         result = self.page.ai_check(
             custom_prompt="""
@@ -215,18 +237,38 @@ class TestGoogleNavigation(unittest.TestCase):
         logger.info(f"Generated {len(result.bugs)} test issues:")
         for bug in result.bugs:
             logger.info(f"- {bug['severity']}: {bug['title']}")
-        
-        time.sleep(1)
 
     def test_report_generation(self):
         """Test that AI check report generation works correctly"""
-        self.page.goto('https://www.google.com')
-        self.page.wait_for_load_state('networkidle')
+        self.goto_google()
         
         # Perform AI check and generate report
         report_gen = self.page.ai_report()
-        
-        time.sleep(1)
+
+class TestReportIndex(unittest.TestCase):
+    """ai_report over JSON Lines results, without a browser or the model"""
+
+    def write_record(self, output_dir, name, url):
+        record = {'timestamp': '20250101_000000', 'url': url, 'screenshot': None,
+                  'testers_results': []}
+        with open(os.path.join(output_dir, name), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+    def test_report_includes_unindexed_jsonl_files(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            # One file written through the index...
+            self.write_record(output_dir, 'ai_checks_20250101_000000.jsonl', 'https://indexed.example/')
+            with open(os.path.join(output_dir, playwright_sync_cotestpilot.RESULTS_INDEX_FILE), 'w') as f:
+                f.write(json.dumps({'file': 'ai_checks_20250101_000000.jsonl', 'offset': 0}) + '\n')
+            # ...and one from before the index existed
+            self.write_record(output_dir, 'legacy_20240101_000000_ai.jsonl', 'https://legacy.example/')
+
+            report_path = playwright_sync_cotestpilot.ai_report(None, output_dir=output_dir)
+            with open(report_path, encoding='utf-8') as f:
+                report = f.read()
+
+        self.assertIn('https://indexed.example/', report)
+        self.assertIn('https://legacy.example/', report)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
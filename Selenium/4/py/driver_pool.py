@@ -0,0 +1,181 @@
+"""
+Per-process pool of Chrome WebDriver sessions
+=============================================
+
+Starting Chrome costs a second or more, so test classes borrow an already
+running driver from the pool instead of launching their own. A driver is
+reset to a blank page with no cookies before it goes back into the pool,
+and every pooled driver is quit when the process exits. Chrome's memory use
+grows over a long run, so a driver that has served MAX_TESTS_PER_DRIVER
+tests is replaced with a fresh one.
+
+WebDriver sessions are not thread-safe: a checked-out driver belongs to one
+test class until it is released.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+MAX_DRIVERS = 4
+
+# Tests run on one Chrome before it is replaced, to cap its memory growth
+MAX_TESTS_PER_DRIVER = 20
+
+# Run headless unless HEADED=1 is set, e.g. to watch tests locally
+HEADLESS = os.environ.get('HEADED') != '1'
+
+# Set by pytest-xdist in each worker process; a plain run counts as one worker
+WORKER_ID = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+
+def profile_dir(index):
+    """Persistent profile directory of the index-th driver of this worker"""
+    # The directory outlives the run, so later runs start with a warm HTTP cache
+    return os.path.join(tempfile.gettempdir(), f"chrome-profile-{WORKER_ID}-{index}")
+
+def chrome_options(user_data_dir):
+    """Options for a pooled driver using the given profile directory"""
+    options = Options()
+    if HEADLESS:
+        for arg in ("--headless=new", "--disable-gpu", "--no-sandbox",
+                    "--disable-dev-shm-usage", "--window-size=1920,1080",
+                    "--memory-pressure-off"):
+            options.add_argument(arg)
+    else:
+        options.add_argument("--start-maximized")
+    # Chrome locks its profile directory, so every driver needs its own
+    options.add_argument(f"--user-data-dir={user_data_dir}")
+    return options
+
+def start_chrome(index):
+    """
+    Start the index-th driver of this worker on its persistent profile.
+
+    If Chrome cannot use that profile, e.g. another test run on this host
+    holds it or a crashed Chrome left its lock behind, start on a fresh
+    throwaway profile instead.
+
+    Returns:
+        The driver, and the throwaway profile directory to delete when it
+        quits (None for the persistent profile)
+    """
+    try:
+        return webdriver.Chrome(options=chrome_options(profile_dir(index))), None
+    except WebDriverException as e:
+        logger.warning("Could not start Chrome on %s, using a fresh profile: %s",
+                       profile_dir(index), e)
+    temp_dir = tempfile.mkdtemp(prefix=f"chrome-profile-{WORKER_ID}-{index}-")
+    try:
+        return webdriver.Chrome(options=chrome_options(temp_dir)), temp_dir
+    except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+class DriverPool:
+    """Lazily created, capped pool of Chrome drivers"""
+
+    def __init__(self, size):
+        self.size = size
+        self._idle = queue.Queue()
+        # Running drivers and the profile directory index each one uses
+        self._all = {}
+        # Tests each running driver has served since it was started
+        self._tests_run = {}
+        # Throwaway profile directories, removed when their driver quits
+        self._temp_profiles = {}
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Check out an idle driver, starting a new one while under the cap"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._all) < self.size:
+                # Reuse the lowest profile index no running driver holds
+                used = set(self._all.values())
+                index = next(i for i in range(self.size) if i not in used)
+                driver, temp_dir = start_chrome(index)
+                if temp_dir:
+                    self._temp_profiles[driver] = temp_dir
+                # Keep Chrome's HTTP cache on, so test classes sharing this
+                # driver reuse the assets earlier page loads fetched
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+                self._all[driver] = index
+                logger.info("Started pooled driver %d/%d", len(self._all), self.size)
+                return driver
+        # Every driver is checked out; wait for one to come back
+        return self._idle.get()
+
+    def record_test(self, driver):
+        """Count a test run on driver"""
+        with self._lock:
+            self._tests_run[driver] = self._tests_run.get(driver, 0) + 1
+
+    def needs_restart(self, driver):
+        """Whether driver has served MAX_TESTS_PER_DRIVER tests and should be replaced"""
+        with self._lock:
+            return self._tests_run.get(driver, 0) >= MAX_TESTS_PER_DRIVER
+
+    def release(self, driver):
+        """Reset a driver's browser state and return it to the pool"""
+        if self.needs_restart(driver):
+            # Quit it now; the next acquire starts a fresh one in its slot
+            logger.info("Retiring pooled driver after %d tests", MAX_TESTS_PER_DRIVER)
+            self.discard(driver)
+            return
+        try:
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+        except Exception as e:
+            # A broken session should not be handed to the next test class
+            logger.warning("Discarding pooled driver: %s", e)
+            self.discard(driver)
+            return
+        self._idle.put(driver)
+
+    def discard(self, driver):
+        """Quit a checked-out driver and free its slot in the pool"""
+        with self._lock:
+            self._all.pop(driver, None)
+            self._tests_run.pop(driver, None)
+            temp_dir = self._temp_profiles.pop(driver, None)
+        self._quit(driver, temp_dir)
+
+    def replace(self, driver):
+        """Quit a checked-out driver and check out a fresh one in its place"""
+        self.discard(driver)
+        return self.acquire()
+
+    def close(self):
+        """Quit every driver the pool has started"""
+        with self._lock:
+            drivers, self._all = list(self._all), {}
+            self._tests_run = {}
+            temp_profiles, self._temp_profiles = self._temp_profiles, {}
+        for driver in drivers:
+            self._quit(driver, temp_profiles.get(driver))
+
+    @staticmethod
+    def _quit(driver, temp_dir=None):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting driver: %s", e)
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+DRIVER_POOL = DriverPool(min(os.cpu_count() or 1, MAX_DRIVERS))
+atexit.register(DRIVER_POOL.close)
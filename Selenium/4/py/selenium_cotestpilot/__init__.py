@@ -101,6 +101,7 @@ Configuration:
            console_verbosity=LogLevel.VERBOSE,
            config={
                'api_rate_limit': 0.25,        # API calls per second
+               'capacity': 4,                 # Back-to-back calls allowed after idle time
                'screenshot_retention_days': 7,  # Screenshot retention period
                'max_retries': 5                # API call retry attempts
            }
@@ -137,6 +138,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import inspect
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import os
 import json
@@ -144,17 +146,46 @@ import os.path
 import logging.handlers
 from enum import Enum
 import time
+import random
 import warnings
-import glob
 import shutil
+import functools
+import base64
+import io
+import hashlib
+import threading
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, Future
 from jinja2 import Template
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; screenshots are then sent as PNG
+    Image = None
+
 # Suppress urllib3 deprecation warnings
 warnings.filterwarnings('ignore', category=DeprecationWarning, module='urllib3')
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dump_bytes(obj: Any) -> bytes:
+    """Serialize obj to indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC)
+    return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
 @dataclass
 class CheckResult:
     """Contains the results of a page check operation."""
@@ -165,23 +196,53 @@ class CheckResult:
     profile: str
     output_file: Optional[str] = None  # Add new field for output file path
 
-try:
-    # Get the directory containing this file
-    package_dir = os.path.dirname(os.path.abspath(__file__))
-    testers_path = os.path.join(package_dir, 'testers.json')
-    
-    with open(testers_path, 'r') as f:
-        TESTERS = json.load(f)['testers']
-    logger.info(f"Loaded {len(TESTERS)} testers from {testers_path}")
-except FileNotFoundError:
-    logger.warning(f"testers.json not found at {testers_path}. No testing agents will be available.")
-    TESTERS = []
-except json.JSONDecodeError:
-    logger.error(f"testers.json at {testers_path} is invalid. No testing agents will be available.")
-    TESTERS = []
-except KeyError:
-    logger.error(f"testers.json at {testers_path} missing 'reporters' key. No testing agents will be available.")
-    TESTERS = []
+# Get the directory containing this file
+package_dir = os.path.dirname(os.path.abspath(__file__))
+testers_path = os.path.join(package_dir, 'testers.json')
+template_path = os.path.join(package_dir, 'report_template.html')
+
+@functools.lru_cache(maxsize=1)
+def _get_testers() -> List[Dict[str, Any]]:
+    """Load the testing agents from testers.json on first use"""
+    try:
+        with open(testers_path, 'r') as f:
+            testers = json.load(f)['testers']
+        logger.info(f"Loaded {len(testers)} testers from {testers_path}")
+        return testers
+    except FileNotFoundError:
+        logger.warning(f"testers.json not found at {testers_path}. No testing agents will be available.")
+    except json.JSONDecodeError:
+        logger.error(f"testers.json at {testers_path} is invalid. No testing agents will be available.")
+    except KeyError:
+        logger.error(f"testers.json at {testers_path} missing 'reporters' key. No testing agents will be available.")
+    return []
+
+@functools.lru_cache(maxsize=1)
+def _get_tester_index():
+    """
+    Lowercase name lookups for tester selection.
+
+    Returns:
+        Tuple of (testers by lowercase name, lowercase names, default tester)
+    """
+    testers_by_lower_name = {t['name'].lower(): t for t in _get_testers()}
+    return testers_by_lower_name, list(testers_by_lower_name), testers_by_lower_name.get('jason')
+
+@functools.lru_cache(maxsize=1)
+def _load_template(mtime: float) -> Template:
+    """Compile the HTML report template; cached per template modification time"""
+    with open(template_path, 'r') as f:
+        return Template(f.read(), autoescape=True)
+
+def _get_template() -> Template:
+    """Return the compiled report template, recompiling only if the file changed"""
+    return _load_template(os.path.getmtime(template_path))
+
+def __getattr__(name):
+    # Keep TESTERS available as a module attribute without loading it at import
+    if name == 'TESTERS':
+        return _get_testers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class LogLevel(Enum):
     NONE = 0
@@ -191,31 +252,86 @@ class LogLevel(Enum):
 # Add new configuration class
 class Config(TypedDict):
     api_rate_limit: float  # Calls per second
+    capacity: int  # Burst size of the API rate limiter
     screenshot_retention_days: int
     max_retries: int
+    max_page_text_chars: int  # Page text sent to the model is cut to this length
+    enable_response_cache: bool  # Reuse vision responses for identical prompt + screenshot
+    batch_testers: bool  # Review the page as all selected testers in one API call
+    max_batch_prompt_chars: int  # Longer batched prompts fall back to one call per tester
+    max_image_dim: int  # Screenshots sent to the model are downscaled to fit this size
+    jpeg_quality: int  # JPEG quality of screenshots sent to the model
 
 # Default configuration
 DEFAULT_CONFIG = Config(
-    api_rate_limit=1.0,  # One call per second
-    screenshot_retention_days=30,
-    max_retries=3
+    api_rate_limit=0.25,  # One call every 4 seconds
+    capacity=4,  # Calls allowed back to back after an idle period
+    screenshot_retention_days=7,
+    max_retries=5,
+    max_page_text_chars=8000,
+    enable_response_cache=False,
+    batch_testers=True,
+    max_batch_prompt_chars=32000,
+    max_image_dim=1536,
+    jpeg_quality=75
 )
 
 # Add rate limiting
-class RateLimiter:
-    def __init__(self, calls_per_second: float):
-        self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0.0
-
-    def wait(self):
-        now = time.time()
-        elapsed = now - self.last_call
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_call = time.time()
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill at refill_rate per second up to capacity, so calls that
+    arrive after an idle period pass without sleeping while the long-run
+    rate stays at refill_rate.
+    """
+    def __init__(self, calls_per_second: float, capacity: float = 1):
+        self.capacity = capacity
+        self.refill_rate = calls_per_second
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def configure(self, calls_per_second: float, capacity: float):
+        """Apply a new rate and capacity, keeping tokens earned so far"""
+        with self._lock:
+            self.refill()
+            self.refill_rate = calls_per_second
+            self.capacity = capacity
+            self.tokens = min(self.tokens, capacity)
+
+    def refill(self):
+        """Add the tokens earned since the last refill; call with the lock held"""
+        now = time.monotonic()
+        gap = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + gap * self.refill_rate)
+        self.last_refill = now
+
+    def allow_request(self, cost: float = 1) -> float:
+        """
+        Take cost tokens if available.
+
+        Returns:
+            0 if the request may proceed, otherwise seconds until enough tokens
+        """
+        with self._lock:
+            self.refill()
+            if self.tokens >= cost:
+                self.tokens -= cost
+                return 0
+            return (cost - self.tokens) / self.refill_rate
+
+    def acquire(self, cost: float = 1):
+        """Block until cost tokens are available and take them"""
+        while True:
+            delay = self.allow_request(cost)
+            if not delay:
+                return
+            # Sleep outside the lock so other callers can refill and check
+            time.sleep(delay)
 
 # Initialize rate limiter
-api_rate_limiter = RateLimiter(DEFAULT_CONFIG['api_rate_limit'])
+api_rate_limiter = TokenBucket(DEFAULT_CONFIG['api_rate_limit'], DEFAULT_CONFIG['capacity'])
 
 # Configure logging with file handler
 def configure_logging(
@@ -237,6 +353,7 @@ def configure_logging(
     global DEFAULT_CONFIG
     if config:
         DEFAULT_CONFIG.update(config)
+        api_rate_limiter.configure(DEFAULT_CONFIG['api_rate_limit'], DEFAULT_CONFIG['capacity'])
     try:
         logging_level = getattr(logging, level.upper())
         logger = logging.getLogger(__name__)
@@ -277,69 +394,8 @@ def configure_logging(
         logging.basicConfig(level=logging.INFO)
         return logging.getLogger(__name__)
 
-def check(self: WebDriver, 
-          profile_search: Optional[str] = None,
-          custom_rules: Optional[Dict[str, Any]] = None,
-          custom_prompt: Optional[str] = None,
-          output: str = 'return list of issues as an array of JSON objects with properties: title, severity, description, why_fix, how_to_fix, confidence (a number between 0 and 1)',
-          testers: Optional[List[str]] = None,
-          label: Optional[str] = None,
-          timeout: int = 30000,
-          console_verbosity: LogLevel = LogLevel.BASIC,
-          save_to_file: bool = True,
-          output_dir: Optional[str] = "ai_check_results") -> CheckResult:
-    """
-    Performs an AI-powered check of the current page.
-    """
-    try:
-        logger.info(f"Starting page check with profile: {profile_search}")
-        
-        # Ensure screenshot directory exists
-        os.makedirs("screenshots", exist_ok=True)
-        
-        # Capture and save screenshot (Selenium version)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = f"screenshots/check_{timestamp}.png"
-        self.get_screenshot_as_file(screenshot_path)
-        
-        # Convert screenshot to base64
-        with open(screenshot_path, "rb") as image_file:
-            import base64
-            screenshot_base64 = base64.b64encode(image_file.read()).decode('utf-8')
-        
-        # Validate inputs
-        if timeout < 1000:
-            logger.warning("Timeout too low, setting to minimum 1000ms")
-            timeout = 1000
-            
-        if custom_rules is not None and not isinstance(custom_rules, dict):
-            logger.error("custom_rules must be a dictionary")
-            raise ValueError("custom_rules must be a dictionary")
-
-        # Select testers - default to just Jason if no testers specified
-        selected_testers = []
-        
-        if testers is None:
-            selected_testers = [t for t in TESTERS if t['name'].lower() == 'jason']
-        else:
-            selected_testers = [
-                t for t in TESTERS 
-                if any(requested.lower() in t['name'].lower() for requested in testers)
-            ]
-            if not selected_testers:
-                logger.warning(f"No matching testers found for {testers}. Using Jason as default tester.")
-                selected_testers = [t for t in TESTERS if t['name'].lower() == 'jason']
-        
-        # Get current page URL and content (Selenium version)
-        url = self.current_url
-        page_text = self.find_element("tag name", "body").text
-        
-        all_findings = []
-        
-        # Run analysis with each selected tester
-        for tester in selected_testers:
-            # Generate vision prompt for this specific tester
-            vision_prompt = f"""Please analyze this webpage for any errors, issues, or problems.
+# Vision prompt pieces, filled in with str.format per check and tester
+_PROMPT_PAGE = """Please analyze this webpage for any errors, issues, or problems.
 
 IMPORTANT: Only return high-confidence issues. It is perfectly acceptable to return no issues if none are found with high confidence.
 For each issue found, include a confidence score between 0 and 1, where:
@@ -358,16 +414,22 @@ Page URL: {url}
 Page Text Content:
 {page_text}
 
-You are {tester['name']}, and this is your expertise and background:
-{tester['biography']}
+"""
+
+_PROMPT_PERSONA = """You are {name}, and this is your expertise and background:
+{biography}
+
+"""
 
-Please identify any:
+_PROMPT_FOCUS = """Please identify any:
 1. Visual errors or layout issues
 2. Content errors or inconsistencies
 3. Functionality problems that are visible
 4. Any other issues that might affect user experience
 
-Output format: {output}
+"""
+
+_PROMPT_OUTPUT = """Output format: {output}
 
 Example format:
 [
@@ -384,93 +446,544 @@ Example format:
 
 return only the JSON array, no other text or comments.
 
-{custom_prompt if custom_prompt else ''}"""
+{custom_prompt}"""
 
-            # Add rate limiting before API calls
-            api_rate_limiter.wait()
-            
-            # Add retries for API calls
-            retries = DEFAULT_CONFIG['max_retries']
-            while retries > 0:
+# Prompt for a single tester
+_PROMPT_TEMPLATE = _PROMPT_PAGE + _PROMPT_PERSONA + _PROMPT_FOCUS + _PROMPT_OUTPUT
+
+# Prompt asking one call to review the page as several testers at once
+_BATCH_PROMPT_TEMPLATE = _PROMPT_PAGE + """Review the page separately as each of these testers, using their expertise and background:
+{personas}
+
+""" + _PROMPT_FOCUS + """Output format for each tester's issues: {output}
+
+Return a JSON object with one entry per tester, in the order listed:
+{{
+    "tester_results": [
+        {{"tester": "<tester name>", "issues": [<that tester's issues>]}}
+    ]
+}}
+
+return only the JSON object, no other text or comments.
+
+{custom_prompt}"""
+
+def _encode_screenshot(png_bytes: bytes) -> str:
+    """
+    Downscale a PNG screenshot and re-encode it as JPEG before base64 encoding.
+
+    Falls back to encoding the original PNG when Pillow is not installed.
+    """
+    image_bytes = png_bytes
+    if Image is not None:
+        try:
+            max_dim = DEFAULT_CONFIG['max_image_dim']
+            img = Image.open(io.BytesIO(png_bytes))
+            img.thumbnail((max_dim, max_dim))
+            buf = io.BytesIO()
+            img.convert('RGB').save(buf, format='JPEG', quality=DEFAULT_CONFIG['jpeg_quality'], optimize=True)
+            image_bytes = buf.getvalue()
+        except Exception as e:
+            logger.warning(f"Could not compress screenshot, sending original: {str(e)}")
+    return base64.b64encode(image_bytes).decode('ascii')
+
+# Collapses whitespace and truncates the body text in the browser, so only the
+# part that goes into the prompt crosses the WebDriver connection
+_PAGE_TEXT_SCRIPT = "return (document.body.innerText || '').replace(/\\s+/g, ' ').slice(0, arguments[0]);"
+
+def _run_one_tester(tester: Dict[str, Any],
+                    url: str,
+                    page_text: str,
+                    output: str,
+                    custom_prompt: Optional[str],
+                    screenshot_base64: str) -> Dict[str, Any]:
+    """
+    Runs the vision analysis for a single tester.
+
+    Safe to call from worker threads; chat_vision applies the shared,
+    thread-safe rate limiter.
+
+    Returns:
+        Findings dict with the tester's name, biography and issues
+    """
+    # Generate vision prompt for this specific tester
+    vision_prompt = _PROMPT_TEMPLATE.format(
+        url=url,
+        page_text=page_text,
+        name=tester['name'],
+        biography=tester['biography'],
+        output=output,
+        custom_prompt=custom_prompt or ''
+    )
+
+    vision_response = _vision_with_retries(vision_prompt, screenshot_base64)
+
+    # Return tester's issues
+    return {
+        'tester': tester['name'],
+        'biography': tester['biography'],
+        'issues': vision_response
+    }
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Seconds to wait before retrying after error.
+
+    Honors a Retry-After header on HTTP errors, otherwise backs off
+    exponentially with jitter so concurrent callers do not retry in lockstep.
+    """
+    response = getattr(error, 'response', None)
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return min(30, 2 ** attempt + random.uniform(0, 0.5))
+
+def _with_retries(fn, *args, **kwargs):
+    """Calls fn, retrying failed calls up to max_retries times with backoff"""
+    max_retries = DEFAULT_CONFIG['max_retries']
+    retries = max_retries
+    while True:
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            retries -= 1
+            if retries <= 0:
+                raise
+            delay = _retry_delay(e, max_retries - retries)
+            logger.warning(f"API call failed, retrying in {delay:.1f}s... ({retries} attempts left)")
+            time.sleep(delay)
+
+def _vision_with_retries(prompt: str, screenshot_base64: str) -> Any:
+    """Calls the vision API, retrying failed calls up to max_retries times"""
+    return _with_retries(_cached_chat_vision, prompt, screenshot_base64)
+
+def _run_batched_testers(testers: List[Dict[str, Any]],
+                         url: str,
+                         page_text: str,
+                         output: str,
+                         custom_prompt: Optional[str],
+                         screenshot_base64: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Runs the vision analysis for several testers in a single API call.
+
+    Returns:
+        Findings dicts in tester order, or None if the prompt is over
+        max_batch_prompt_chars or the response does not cover every tester,
+        in which case the caller should fall back to one call per tester
+    """
+    personas = "\n\n".join(
+        f"{i}. {tester['name']}:\n{tester['biography']}"
+        for i, tester in enumerate(testers, 1)
+    )
+    vision_prompt = _BATCH_PROMPT_TEMPLATE.format(
+        url=url,
+        page_text=page_text,
+        personas=personas,
+        output=output,
+        custom_prompt=custom_prompt or ''
+    )
+    if len(vision_prompt) > DEFAULT_CONFIG['max_batch_prompt_chars']:
+        logger.info("Batched tester prompt too long, checking testers one call at a time")
+        return None
+
+    vision_response = _vision_with_retries(vision_prompt, screenshot_base64)
+    try:
+        issues_by_tester = {
+            entry['tester'].lower(): entry.get('issues', [])
+            for entry in vision_response['tester_results']
+        }
+    except (TypeError, KeyError, AttributeError):
+        logger.warning("Could not split batched tester response, checking testers one call at a time")
+        return None
+
+    # A tester the model left out or misnamed would silently lose its findings
+    missing = [tester['name'] for tester in testers if tester['name'].lower() not in issues_by_tester]
+    if missing:
+        logger.warning(f"Batched response has no results for {missing}, checking testers one call at a time")
+        return None
+
+    return [
+        {
+            'tester': tester['name'],
+            'biography': tester['biography'],
+            'issues': issues_by_tester[tester['name'].lower()]
+        }
+        for tester in testers
+    ]
+
+# Single background writer for screenshots, so disk writes overlap the API calls
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cotestpilot-io')
+
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, 'wb') as f:
+        f.write(data)
+
+SCREENSHOT_DIR = "screenshots"
+# Fraction of checks that also prune old screenshots, to keep the cost off most calls
+SCREENSHOT_PRUNE_PROBABILITY = 0.01
+
+def _prune_screenshots(directory: str = SCREENSHOT_DIR, days: Optional[int] = None) -> int:
+    """
+    Delete check screenshots older than screenshot_retention_days.
+
+    Args:
+        directory: Directory holding the screenshots
+        days: Retention period in days (default: DEFAULT_CONFIG['screenshot_retention_days'])
+
+    Returns:
+        Number of screenshots removed
+    """
+    if days is None:
+        days = DEFAULT_CONFIG['screenshot_retention_days']
+    cutoff = time.time() - days * 86400
+    removed = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not (entry.name.startswith('check_') and entry.is_file()):
+                    continue
                 try:
-                    vision_response = chat_vision(vision_prompt, screenshot_base64)
-                    break
-                except Exception as e:
-                    retries -= 1
-                    if retries == 0:
-                        raise
-                    logger.warning(f"API call failed, retrying... ({retries} attempts left)")
-                    time.sleep(2)
-            
-            # Add tester's issues to results
-            all_findings.append({
-                'tester': tester['name'],
-                'biography': tester['biography'],
-                'issues': vision_response
-            })
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning(f"Could not remove old screenshot {entry.path}: {str(e)}")
+    except FileNotFoundError:
+        return 0
+    if removed:
+        logger.info(f"Removed {removed} screenshots older than {days} days from {directory}")
+    return removed
+
+@dataclass
+class _PageCapture:
+    """Screenshot and page text taken once and shared by the checks of a page"""
+    timestamp: str
+    url: str
+    page_text: str
+    screenshot_base64: str
+    screenshot_path: Optional[str]
+    screenshot_write: Any  # Future of the background screenshot write, or None
+
+def _capture_page(driver: WebDriver, save_to_file: bool, page_text: Optional[str] = None) -> _PageCapture:
+    """
+    Take the screenshot and page text a check sends to the model.
+
+    A page_text the caller already has is normalized the way the in-browser
+    script does it, and saves reading the text over the WebDriver connection.
+    """
+    # Occasionally prune old screenshots in the background
+    if random.random() < SCREENSHOT_PRUNE_PROBABILITY:
+        _IO_POOL.submit(_prune_screenshots)
+    
+    # Capture screenshot in memory (Selenium version); when results are
+    # saved it is written in the background while the testers run
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    screenshot_png = driver.get_screenshot_as_png()
+    screenshot_path = None
+    screenshot_write = None
+    if save_to_file:
+        os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+        # Microseconds keep parallel workers sharing SCREENSHOT_DIR from
+        # overwriting each other's screenshots
+        screenshot_path = f"{SCREENSHOT_DIR}/check_{now.strftime('%Y%m%d_%H%M%S_%f')}.png"
+        screenshot_write = _IO_POOL.submit(_write_bytes, screenshot_path, screenshot_png)
+    
+    # Get current page URL and content (Selenium version)
+    max_chars = DEFAULT_CONFIG['max_page_text_chars']
+    if page_text is None:
+        page_text = driver.execute_script(_PAGE_TEXT_SCRIPT, max_chars)
+    else:
+        page_text = ' '.join(page_text.split())[:max_chars]
+    return _PageCapture(
+        timestamp=timestamp,
+        url=driver.current_url,
+        page_text=page_text,
+        screenshot_base64=_encode_screenshot(screenshot_png),
+        screenshot_path=screenshot_path,
+        screenshot_write=screenshot_write
+    )
+
+def _check_capture(capture: _PageCapture,
+                   profile_search: Optional[str] = None,
+                   custom_rules: Optional[Dict[str, Any]] = None,
+                   custom_prompt: Optional[str] = None,
+                   output: str = 'return list of issues as an array of JSON objects with properties: title, severity, description, why_fix, how_to_fix, confidence (a number between 0 and 1)',
+                   testers: Optional[List[str]] = None,
+                   label: Optional[str] = None,
+                   timeout: int = 30000,
+                   console_verbosity: LogLevel = LogLevel.BASIC,
+                   save_to_file: bool = True,
+                   output_dir: Optional[str] = "ai_check_results",
+                   include_raw: bool = False) -> CheckResult:
+    """
+    Runs the testers of a check against an already captured page.
+
+    Makes no WebDriver calls, so several can run at once on one capture.
+    """
+    # Validate inputs
+    if timeout < 1000:
+        logger.warning("Timeout too low, setting to minimum 1000ms")
+        timeout = 1000
         
-        # Prepare results for saving
-        check_result = {
+    if custom_rules is not None and not isinstance(custom_rules, dict):
+        logger.error("custom_rules must be a dictionary")
+        raise ValueError("custom_rules must be a dictionary")
+
+    # Select testers - default to just Jason if no testers specified
+    testers_by_lower_name, tester_lower_names, default_tester = _get_tester_index()
+    default_testers = [default_tester] if default_tester else []
+    
+    if testers is None:
+        selected_testers = default_testers
+    else:
+        requested_lower = {requested.lower() for requested in testers}
+        selected_testers = [
+            testers_by_lower_name[name] for name in tester_lower_names
+            if any(requested in name for requested in requested_lower)
+        ]
+        if not selected_testers:
+            logger.warning(f"No matching testers found for {testers}. Using Jason as default tester.")
+            selected_testers = default_testers
+    
+    url = capture.url
+    page_text = capture.page_text
+    screenshot_base64 = capture.screenshot_base64
+    timestamp = capture.timestamp
+    screenshot_path = capture.screenshot_path if save_to_file else None
+    
+    # Review the page as all selected testers in one API call when there
+    # are several of them
+    all_findings = None
+    if len(selected_testers) > 1 and DEFAULT_CONFIG['batch_testers']:
+        all_findings = _run_batched_testers(
+            selected_testers, url, page_text, output, custom_prompt, screenshot_base64
+        )
+    
+    # Otherwise run one call per tester concurrently; results keep the
+    # order of selected_testers
+    if all_findings is None:
+        max_workers = max(1, min(8, len(selected_testers)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            all_findings = list(executor.map(
+                lambda tester: _run_one_tester(
+                    tester, url, page_text, output, custom_prompt, screenshot_base64
+                ),
+                selected_testers
+            ))
+    
+    # Make sure the screenshot exists before results point at it
+    if screenshot_path and capture.screenshot_write:
+        capture.screenshot_write.result()
+    
+    # Prepare results for saving
+    check_result = {
+        'timestamp': timestamp,
+        'url': url,
+        'screenshot': screenshot_path,
+        'testers_results': all_findings
+    }
+    
+    # Extract all issues from testers_results
+    all_issues = []
+    for tester_result in all_findings:
+        # chat_vision already returns parsed JSON
+        issues = tester_result.get('issues')
+        if not isinstance(issues, list):
+            logger.warning(f"Unexpected issues format from tester {tester_result.get('tester')}: {type(issues).__name__}")
+            continue
+        all_issues.extend(issues)
+
+    # Only save to file if save_to_file is True
+    output_file_path = None
+    if save_to_file:
+        # Microseconds keep checks of a batch that finish in the same second apart
+        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        output_file = f"{label}_{timestamp_str}_ai.json" if label else f"ai_checks_{timestamp_str}.json"
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            output_file_path = os.path.join(output_dir, output_file)
+        
+        with open(output_file_path, 'wb', buffering=1 << 16) as f:
+            f.write(_json_dump_bytes(check_result))
+        
+        logger.info(f"AI check results saved to {output_file}")
+    
+    return CheckResult(
+        timestamp=datetime.now(),
+        url=url,
+        bugs=all_issues,
+        raw_response=check_result if include_raw else {
             'timestamp': timestamp,
             'url': url,
             'screenshot': screenshot_path,
-            'testers_results': all_findings
-        }
-        
-        # Extract all issues from testers_results
-        all_issues = []
-        for tester_result in all_findings:
-            try:
-                if isinstance(tester_result['issues'], str):
-                    issues = json.loads(tester_result['issues'])
-                else:
-                    issues = tester_result['issues']
-                all_issues.extend(issues)
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Error parsing issues from tester {tester_result.get('tester')}: {str(e)}")
-
-        # Only save to file if save_to_file is True
-        output_file_path = None
-        if save_to_file:
-            timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"{label}_{timestamp_str}_ai.json" if label else f"ai_checks_{timestamp_str}.json"
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-                output_file_path = os.path.join(output_dir, output_file)
-            
-            with open(output_file_path, 'w') as f:
-                json.dump(check_result, f, indent=2)
-            
-            logger.info(f"AI check results saved to {output_file}")
-        
-        return CheckResult(
-            timestamp=datetime.now(),
-            url=url,
-            bugs=all_issues,
-            raw_response=check_result,
-            profile=profile_search or "default",
-            output_file=output_file_path
+            'num_issues': len(all_issues)
+        },
+        profile=profile_search or "default",
+        output_file=output_file_path
+    )
+
+def _failed_result(url: str, profile_search: Optional[str], error: Exception) -> CheckResult:
+    """CheckResult returned in place of raising when a check fails"""
+    return CheckResult(
+        timestamp=datetime.now(),
+        url=url,
+        bugs=[],
+        raw_response={"error": str(error)},
+        profile=profile_search or "default",
+        output_file=None
+    )
+
+def check(self: WebDriver, 
+          profile_search: Optional[str] = None,
+          custom_rules: Optional[Dict[str, Any]] = None,
+          custom_prompt: Optional[str] = None,
+          output: str = 'return list of issues as an array of JSON objects with properties: title, severity, description, why_fix, how_to_fix, confidence (a number between 0 and 1)',
+          testers: Optional[List[str]] = None,
+          label: Optional[str] = None,
+          timeout: int = 30000,
+          console_verbosity: LogLevel = LogLevel.BASIC,
+          save_to_file: bool = True,
+          output_dir: Optional[str] = "ai_check_results",
+          include_raw: bool = False,
+          page_text: Optional[str] = None) -> CheckResult:
+    """
+    Performs an AI-powered check of the current page.
+
+    raw_response holds a short summary of the check unless include_raw is
+    set, in which case it holds the full per-tester results. Pass page_text
+    when the page's visible text has already been read to skip reading it
+    again.
+    """
+    try:
+        logger.info(f"Starting page check with profile: {profile_search}")
+        capture = _capture_page(self, save_to_file, page_text)
+        return _check_capture(
+            capture,
+            profile_search=profile_search,
+            custom_rules=custom_rules,
+            custom_prompt=custom_prompt,
+            output=output,
+            testers=testers,
+            label=label,
+            timeout=timeout,
+            console_verbosity=console_verbosity,
+            save_to_file=save_to_file,
+            output_dir=output_dir,
+            include_raw=include_raw
         )
             
     except Exception as e:
         logger.exception(f"Critical error during page check: {str(e)}")
-        return CheckResult(
-            timestamp=datetime.now(),
-            url=self.current_url if hasattr(self, 'current_url') else "unknown",
-            bugs=[],
-            raw_response={"error": str(e)},
-            profile=profile_search or "default",
-            output_file=None
+        return _failed_result(
+            self.current_url if hasattr(self, 'current_url') else "unknown",
+            profile_search,
+            e
         )
 
+async def check_async(self: WebDriver,
+                      save_to_file: bool = True,
+                      page_text: Optional[str] = None,
+                      **kwargs) -> CheckResult:
+    """
+    Awaitable version of ai_check, taking the same arguments.
+
+    The page is captured on the calling thread, since WebDriver sessions are
+    not thread-safe; the model calls then run in a worker thread so the event
+    loop stays free while they are in flight.
+    """
+    profile_search = kwargs.get('profile_search')
+    try:
+        logger.info(f"Starting page check with profile: {profile_search}")
+        capture = _capture_page(self, save_to_file, page_text)
+        return await asyncio.to_thread(_check_capture, capture, save_to_file=save_to_file, **kwargs)
+    except Exception as e:
+        logger.exception(f"Critical error during page check: {str(e)}")
+        return _failed_result(
+            self.current_url if hasattr(self, 'current_url') else "unknown",
+            profile_search,
+            e
+        )
+
+def check_batch(self: WebDriver,
+                variants: List[Dict[str, Any]],
+                page_text: Optional[str] = None) -> List[CheckResult]:
+    """
+    Performs several AI-powered checks of the current page from one capture.
+
+    The screenshot and page text are taken once and shared by every variant,
+    and the variants' API calls run concurrently.
+
+    Args:
+        variants: One dict of ai_check keyword arguments per check
+        page_text: The page's visible text, if already read
+
+    Returns:
+        CheckResults in the order of variants
+    """
+    if not variants:
+        return []
+    try:
+        logger.info(f"Starting batch of {len(variants)} page checks")
+        capture = _capture_batch(self, variants, page_text)
+    except Exception as e:
+        return _failed_batch(self, variants, e)
+    return _run_variants(capture, variants)
+
+async def check_batch_async(self: WebDriver,
+                            variants: List[Dict[str, Any]],
+                            page_text: Optional[str] = None) -> List[CheckResult]:
+    """
+    Awaitable version of ai_check_batch, taking the same arguments.
+
+    Like ai_check_async, the page is captured on the calling thread and only
+    the model calls run in worker threads.
+    """
+    if not variants:
+        return []
+    try:
+        logger.info(f"Starting batch of {len(variants)} page checks")
+        capture = _capture_batch(self, variants, page_text)
+    except Exception as e:
+        return _failed_batch(self, variants, e)
+    return await asyncio.to_thread(_run_variants, capture, variants)
+
+def _capture_batch(driver: WebDriver, variants: List[Dict[str, Any]], page_text: Optional[str]) -> _PageCapture:
+    """Capture the page once for every variant of a batch"""
+    save_any = any(variant.get('save_to_file', True) for variant in variants)
+    return _capture_page(driver, save_any, page_text)
+
+def _failed_batch(driver: WebDriver, variants: List[Dict[str, Any]], error: Exception) -> List[CheckResult]:
+    """One failed CheckResult per variant, for a batch whose capture failed"""
+    logger.exception(f"Critical error during page check: {str(error)}")
+    url = driver.current_url if hasattr(driver, 'current_url') else "unknown"
+    return [_failed_result(url, variant.get('profile_search'), error) for variant in variants]
+
+def _run_variants(capture: _PageCapture, variants: List[Dict[str, Any]]) -> List[CheckResult]:
+    """Run each variant's check against capture concurrently; makes no WebDriver calls"""
+    def run_variant(variant):
+        try:
+            return _check_capture(capture, **variant)
+        except Exception as e:
+            logger.exception(f"Critical error during page check: {str(e)}")
+            return _failed_result(capture.url, variant.get('profile_search'), e)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(variants))) as executor:
+        return list(executor.map(run_variant, variants))
+
 def _sync_impl(driver: WebDriver, url: str, profile_search: str, custom_rules: dict, page_text: str, screenshot: str):
     """Internal sync implementation for Selenium"""
+    # Read both viewport dimensions in one WebDriver round-trip
+    width, height = driver.execute_script("return [window.innerWidth, window.innerHeight]")
     metadata = {
         "title": driver.title,
         "url": driver.current_url,
         "viewport": {
-            "width": driver.execute_script("return window.innerWidth"),
-            "height": driver.execute_script("return window.innerHeight")
+            "width": width,
+            "height": height
         }
     }
     
@@ -490,57 +1003,112 @@ def _sync_impl(driver: WebDriver, url: str, profile_search: str, custom_rules: d
         output_file=None
     )
 
-def ai_report(self: WebDriver, output_dir: str = "ai_check_results") -> str:
+def _project_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the fields of a saved check result that the report template uses"""
+    return {
+        'timestamp': result.get('timestamp'),
+        'url': result.get('url'),
+        'screenshot': result.get('screenshot'),
+        'testers_results': [
+            {
+                'tester': tester_result.get('tester'),
+                'biography': tester_result.get('biography'),
+                'issues': tester_result.get('issues')
+            }
+            for tester_result in result.get('testers_results', [])
+        ]
+    }
+
+def _stage_file(src: str, dst: str) -> None:
+    """
+    Make src available at dst, hardlinking when possible instead of copying.
+
+    Screenshots are never modified after a check, so an existing dst is kept.
+    """
+    if os.path.exists(dst):
+        return
+    try:
+        os.link(src, dst)
+    except (OSError, NotImplementedError):
+        shutil.copy2(src, dst)
+
+# Reports are built on their own thread; they wait on _IO_POOL for pruning,
+# so they cannot run on it
+_REPORT_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cotestpilot-report')
+
+def ai_report(self: WebDriver,
+              output_dir: str = "ai_check_results",
+              background: bool = False) -> Union[str, Future]:
     """
     Generate an HTML report from AI check results
     
     Args:
         self: Selenium WebDriver instance
         output_dir: Directory containing JSON result files
+        background: Build the report on a writer thread and return at once
         
     Returns:
-        Path to the generated HTML report
+        Path to the generated HTML report, or with background set a Future
+        that resolves to that path
     """
+    if background:
+        return _REPORT_POOL.submit(_generate_report, output_dir)
+    return _generate_report(output_dir)
+
+def _generate_report(output_dir: str) -> str:
+    """Build the HTML report; makes no WebDriver calls, so any thread may run it"""
     try:
         logger.info(f"Generating report from results in {output_dir}")
         
+        # Prune old screenshots while the results are loaded
+        prune = _IO_POOL.submit(_prune_screenshots)
+        
         # Create reports directory if it doesn't exist
         reports_dir = os.path.join(output_dir, "reports")
         os.makedirs(reports_dir, exist_ok=True)
         
         # Find all JSON files in the output directory
-        json_files = glob.glob(os.path.join(output_dir, "ai_*.json"))
+        with os.scandir(output_dir) as entries:
+            json_files = [
+                entry.path for entry in entries
+                if entry.name.startswith('ai_') and entry.name.endswith('.json')
+            ]
         
-        # Collect all results
+        # Collect all results, keeping only what the report shows so large
+        # raw responses are freed file by file
         all_results = []
         for json_file in json_files:
             try:
-                with open(json_file, 'r') as f:
-                    results = json.load(f)
-                    if isinstance(results, list):
-                        all_results.extend(results)
-                    else:
-                        all_results.append(results)
+                with open(json_file, 'rb') as f:
+                    results = _json_loads(f.read())
+                if isinstance(results, list):
+                    all_results.extend(_project_result(r) for r in results)
+                else:
+                    all_results.append(_project_result(results))
             except Exception as e:
                 logger.warning(f"Error reading {json_file}: {str(e)}")
         
-        # Get template from package directory
-        package_dir = os.path.dirname(os.path.abspath(__file__))
-        template_path = os.path.join(package_dir, 'report_template.html')
+        # Finish pruning first so only kept screenshots are staged
+        prune.result()
         
-        # Copy screenshots to reports directory
+        # Stage screenshots in the reports directory, once per file
+        to_stage = {}
         for result in all_results:
-            if 'screenshot' in result:
-                screenshot_path = result['screenshot']
-                if os.path.exists(screenshot_path):
-                    dest_path = os.path.join(reports_dir, os.path.basename(screenshot_path))
-                    shutil.copy2(screenshot_path, dest_path)
-                    # Update path in result to be relative
-                    result['screenshot'] = os.path.join('reports', os.path.basename(screenshot_path))
+            screenshot_path = result.get('screenshot')
+            if screenshot_path and os.path.exists(screenshot_path):
+                name = os.path.basename(screenshot_path)
+                to_stage.setdefault(name, screenshot_path)
+                # Update path in result to be relative
+                result['screenshot'] = os.path.join('reports', name)
+        if to_stage:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(
+                    lambda item: _stage_file(item[1], os.path.join(reports_dir, item[0])),
+                    to_stage.items()
+                ))
         
         # Generate report
-        with open(template_path, 'r') as f:
-            template = Template(f.read())
+        template = _get_template()
             
         report_html = template.render(
             results=all_results,
@@ -559,17 +1127,21 @@ def ai_report(self: WebDriver, output_dir: str = "ai_check_results") -> str:
         logger.exception(f"Error generating report: {str(e)}")
         raise
 
-# Now attach methods to WebDriver class
-setattr(webdriver.Remote, "ai_check", check)
-setattr(webdriver.Remote, "ai_report", ai_report)
-setattr(webdriver.Chrome, "ai_check", check)
-setattr(webdriver.Chrome, "ai_report", ai_report)
-setattr(webdriver.Firefox, "ai_check", check)
-setattr(webdriver.Firefox, "ai_report", ai_report)
-setattr(webdriver.Safari, "ai_check", check)
-setattr(webdriver.Safari, "ai_report", ai_report)
-setattr(webdriver.Edge, "ai_check", check)
-setattr(webdriver.Edge, "ai_report", ai_report)
+# Now attach methods to WebDriver class; Chrome, Firefox, Safari and Edge all
+# subclass webdriver.Remote, so they inherit these
+for name, method in (("ai_check", check), ("ai_check_async", check_async),
+                     ("ai_check_batch", check_batch), ("ai_check_batch_async", check_batch_async),
+                     ("ai_report", ai_report)):
+    setattr(webdriver.Remote, name, method)
+
+# Markdown code fences the model sometimes wraps its JSON in
+_FENCE_RE = re.compile(r'```.*?\n|```', re.DOTALL)
+
+def _strip_code_fences(content: str) -> str:
+    """Remove markdown code fences from a model response"""
+    if '```' not in content:
+        return content
+    return _FENCE_RE.sub('', content)
 
 def getTimeStampStr():
     """Returns current timestamp as a formatted string"""
@@ -578,9 +1150,18 @@ def getTimeStampStr():
 # Get API key from environment variable
 api_key = os.getenv('OPENAI_API_KEY')
 if not api_key:
-    alert('jj')
     logger.warning("OPENAI_API_KEY environment variable not set. GPT chat functionality will not work.")
 
+# Pooled keep-alive connections to the OpenAI API, shared by all calls and
+# worker threads; the auth headers are set once here
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0))
+_SESSION.headers["Content-Type"] = "application/json"
+# Without a key, send no Authorization header rather than "Bearer None"
+if api_key:
+    _SESSION.headers["Authorization"] = f"Bearer {api_key}"
+
 def gptchat(prompt, add_time=True):
     """
     Send a prompt to GPT and get the response
@@ -603,11 +1184,6 @@ def gptchat(prompt, add_time=True):
         prompt = "Current time: %s\n%s" % (getTimeStampStr(), prompt)
     
     
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-
     payload = {
         "model": "gpt-4o-mini",
         "messages": [
@@ -625,7 +1201,7 @@ def gptchat(prompt, add_time=True):
         "format": "json"
     }
 
-    response = requests.post("https://api.openai.com/v1/chat/completions", headers=headers, json=payload)
+    response = _with_retries(_post_chat, payload)
     
     resp = response.json()
     #print('RESP:%s' % (resp))
@@ -634,11 +1210,55 @@ def gptchat(prompt, add_time=True):
     zero = choices[0]
     msg = zero['message']
     content = msg['content']
-    cleaned_content = re.sub(r'```.*?\n|```', '', content)
+    cleaned_content = _strip_code_fences(content)
     #print('cleaned_content', cleaned_content)
 
     return cleaned_content
 
+def _post_chat(payload: Dict[str, Any]) -> requests.Response:
+    """POST a chat completion request, raising for error status codes"""
+    response = _SESSION.post(OPENAI_CHAT_URL, json=payload, timeout=30)
+    response.raise_for_status()
+    return response
+
+OPENAI_MODELS_URL = "https://api.openai.com/v1/models"
+
+def warmup() -> bool:
+    """
+    Prepare for the first check ahead of time.
+
+    Loads testers.json and the report template, and opens a keep-alive TLS
+    connection to the OpenAI API with a cheap authenticated request, so the
+    first ai_check does not pay for them.
+
+    Returns:
+        True if the API answered, False if it could not be reached
+    """
+    _get_tester_index()
+    try:
+        _get_template()
+    except OSError as e:
+        logger.warning(f"Could not preload report template: {str(e)}")
+    if not api_key:
+        logger.warning("OPENAI_API_KEY not set, skipping API warmup")
+        return False
+    try:
+        # Closing the response returns its connection to the session's pool,
+        # where the first ai_check picks it up
+        with _SESSION.get(OPENAI_MODELS_URL, timeout=10) as response:
+            response.raise_for_status()
+        return True
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"API warmup failed: {str(e)}")
+        return False
+
+def _is_retryable(error: requests.exceptions.RequestException) -> bool:
+    """Rate limits, server errors and connection problems are worth retrying"""
+    response = error.response
+    if response is None:
+        return True
+    return response.status_code == 429 or response.status_code >= 500
+
 def chat_vision(prompt, base64_image, add_time=True):
     """Enhanced error handling for vision API calls"""
     try:
@@ -655,11 +1275,9 @@ def chat_vision(prompt, base64_image, add_time=True):
             prompt = "Current time: %s\n%s" % (getTimeStampStr(), prompt)
         #return gptchat(prompt)
         
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
-
+        # Rate limit here so every caller, including concurrent testers, shares it
+        api_rate_limiter.acquire()
+        
         payload = {
             "model": "gpt-4o-mini",
             "messages": [
@@ -683,10 +1301,9 @@ def chat_vision(prompt, base64_image, add_time=True):
             "format": "json"
         }
 
-        response = requests.post("https://api.openai.com/v1/chat/completions", 
-                               headers=headers, 
-                               json=payload,
-                               timeout=30)  # Add timeout
+        response = _SESSION.post(OPENAI_CHAT_URL, 
+                                 json=payload,
+                                 timeout=30)  # Add timeout
         response.raise_for_status()  # Raise exception for bad status codes
         
         resp = response.json()
@@ -695,28 +1312,57 @@ def chat_vision(prompt, base64_image, add_time=True):
         zero = choices[0]
         msg = zero['message']
         content = msg['content']
-        cleaned_content = re.sub(r'```.*?\n|```', '', content)
+        cleaned_content = _strip_code_fences(content)
         #print('cleaned_content', cleaned_content)
         ret = json.loads(cleaned_content)
 
         return ret
         
     except requests.exceptions.RequestException as e:
+        if _is_retryable(e):
+            # Let _with_retries back off and try again
+            raise
         logger.error(f"API request failed: {str(e)}")
-        return "[]"  # Return empty JSON array as fallback
+        return []  # Return empty issue list as fallback
     except Exception as e:
         logger.exception(f"Error in chat_vision: {str(e)}")
-        return "[]"  # Return empty JSON array as fallback
+        return []  # Return empty issue list as fallback
 
-# Print initialization message
-print('coTestPilot initialized')
+# On-disk cache of vision responses, used when enable_response_cache is set
+RESPONSE_CACHE_DIR = ".ai_cache"
 
-# Configure logging
-configure_logging(
-    level="DEBUG",
-    config={
-        'api_rate_limit': 0.25,  # One call every 4 seconds
-        'screenshot_retention_days': 7,
-        'max_retries': 5
-    }
-)
\ No newline at end of file
+def _response_cache_key(prompt: str, base64_image: str) -> str:
+    prompt_hash = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+    image_hash = hashlib.blake2b(base64_image.encode('ascii'), digest_size=16).hexdigest()
+    return prompt_hash + image_hash
+
+@functools.lru_cache(maxsize=256)
+def _read_cached_response(path: str) -> Any:
+    """Load a cached response, raising FileNotFoundError on a miss"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+def _cached_chat_vision(prompt: str, base64_image: str) -> Any:
+    """
+    chat_vision with an optional memory + disk cache keyed on prompt and screenshot.
+
+    Only non-empty responses are cached, so the empty-list failure fallback
+    is never stored.
+    """
+    if not DEFAULT_CONFIG['enable_response_cache']:
+        return chat_vision(prompt, base64_image)
+
+    path = os.path.join(RESPONSE_CACHE_DIR, f"{_response_cache_key(prompt, base64_image)}.json")
+    try:
+        response = _read_cached_response(path)
+        logger.debug(f"Using cached vision response {path}")
+        return response
+    except (FileNotFoundError, ValueError):
+        pass
+
+    response = chat_vision(prompt, base64_image)
+    if response:
+        os.makedirs(RESPONSE_CACHE_DIR, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(_json_dump_bytes(response))
+    return response
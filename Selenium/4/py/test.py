@@ -1,17 +1,66 @@
+"""
+Selenium AI Testing Suite
+=========================
+
+This test suite demonstrates the usage of selenium-cotestpilot for automated AI-powered testing.
+
+How to run these tests:
+1. From command line:
+   python -m unittest test.py
+
+2. In parallel with pytest-xdist (pip install pytest pytest-xdist):
+   pytest -n auto --dist=load test.py
+
+   WebDriver sessions are not thread-safe, so parallelism is per process:
+   each worker starts its own Chrome with a private profile directory.
+
+3. Without the tests that wait on AI model calls, for quick feedback:
+   pytest -m "not slow" test.py
+
+Chrome runs headless by default; set HEADED=1 to watch it.
+
+Drivers come from driver_pool.py, which keeps them running between test
+classes and quits them when the process exits.
+"""
+
 import unittest
-from unittest import skipIf
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import time
-import selenium_cotestpilot
 import json
 import os
 import logging
+import functools
+import hashlib
+import pickle
+import sqlite3
+import tempfile
+from contextlib import closing
+from types import SimpleNamespace
+from unittest import mock
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import pytest
+    # Tests that wait on model calls, directly or through the shared batch;
+    # skip them with pytest -m "not slow"
+    slow = pytest.mark.slow
+except ImportError:
+    # Plain unittest runs every test
+    def slow(test):
+        return test
+
+# Selenium, the pool and selenium_cotestpilot are imported in setUpClass, so
+# collecting the tests (e.g. with -k or on xdist workers) does not load them
 
 # Add logging configuration
 logger = logging.getLogger(__name__)
@@ -20,158 +69,361 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
-class TestGoogleNavigation(unittest.TestCase):
+GOOGLE_URL = 'https://www.google.com'
+
+# Where test_json_output_file saves its check; created once in setUpClass
+TEST_RESULTS_DIR = Path(__file__).parent / 'test_results'
+
+# Seconds to wait for a page's load event
+LOAD_TIMEOUT = 10
+
+# SQLite cache of ai_check results so repeat runs skip identical LLM calls.
+# Set COTESTPILOT_TEST_CACHE=0 to always call the model.
+CACHE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.ai_check_cache.sqlite')
+CACHE_ENABLED = os.environ.get('COTESTPILOT_TEST_CACHE', '1') != '0'
+
+def _open_cache(db):
+    # xdist workers share the file; wait on their write locks instead of failing
+    conn = sqlite3.connect(db, timeout=30)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS ai_check "
+        "(key TEXT PRIMARY KEY, created REAL NOT NULL, result BLOB NOT NULL)"
+    )
+    return conn
+
+def _is_failed(result):
+    """Whether a CheckResult, or any in a list of them, records a failed check"""
+    results = result if isinstance(result, list) else [result]
+    return any('error' in (getattr(r, 'raw_response', None) or {}) for r in results)
+
+def lru_sqlite_cache(db, ttl):
+    """Cache an async driver check function's results in SQLite for ttl seconds"""
+    def decorator(check):
+        @functools.wraps(check)
+        async def wrapper(driver, page_text, **kwargs):
+            if not CACHE_ENABLED:
+                return await check(driver, page_text, **kwargs)
+            # Key on the visible text rather than outerHTML, which carries per-load nonces
+            payload = (driver.current_url + '\n' + ' '.join(page_text.split()) + '\n'
+                       + json.dumps(kwargs, sort_keys=True))
+            key = hashlib.blake2b(payload.encode('utf-8')).hexdigest()
+            with closing(_open_cache(db)) as conn:
+                row = conn.execute(
+                    "SELECT result FROM ai_check WHERE key = ? AND created > ?",
+                    (key, time.time() - ttl)
+                ).fetchone()
+            if row:
+                return pickle.loads(row[0])
+            result = await check(driver, page_text, **kwargs)
+            # A failed check (API error, timeout, rate limit) must not be
+            # replayed to later tests for the whole TTL
+            if _is_failed(result):
+                return result
+            with closing(_open_cache(db)) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ai_check (key, created, result) VALUES (?, ?, ?)",
+                    (key, time.time(), pickle.dumps(result))
+                )
+            return result
+        return wrapper
+    return decorator
+
+@lru_sqlite_cache(db=CACHE_DB, ttl=3600)
+async def cached_ai_check_batch(driver, page_text, **kwargs):
+    """Run driver.ai_check_batch_async, reusing cached results for the same page and variants"""
+    return await driver.ai_check_batch_async(page_text=page_text, **kwargs)
+
+# The checks the read-only tests inspect, run together as one batch
+CHECK_VARIANTS = {
+    'default': {},
+    'testers': {
+        'testers': ['Jason', 'Alice'],
+        'label': 'google_homepage'
+    },
+    'custom_rules': {
+        'custom_rules': {
+            'check_contrast': True,
+            'min_font_size': 12
+        },
+        'custom_prompt': "Pay special attention to accessibility issues"
+    },
+}
+
+REQUIRED_FIELDS = frozenset({'timestamp', 'url', 'bugs', 'raw_response', 'profile'})
+REQUIRED_BUG_FIELDS = frozenset({
+    'title', 'severity', 'description', 'why_fix', 'how_to_fix', 'confidence'
+})
+
+RESULT_SCHEMA = {
+    "type": "object",
+    "required": sorted(REQUIRED_FIELDS),
+    "properties": {
+        "url": {"type": "string"},
+        "bugs": {"type": "array"},
+        "raw_response": {"type": "object"},
+        "profile": {"type": "string"}
+    }
+}
+BUG_SCHEMA = {
+    "type": "object",
+    "required": sorted(REQUIRED_BUG_FIELDS),
+    "properties": {
+        "confidence": {"type": "number", "minimum": 0, "maximum": 1}
+    }
+}
+
+# fastjsonschema compiles each schema to a Python validator function once;
+# without it the tests fall back to checking the required fields
+if fastjsonschema:
+    validate_result = fastjsonschema.compile(RESULT_SCHEMA)
+    validate_bug = fastjsonschema.compile(BUG_SCHEMA)
+else:
+    validate_result = validate_bug = None
+
+@functools.lru_cache(maxsize=32)
+def _load_json_file(path, mtime_ns):
+    # mtime_ns is part of the cache key, so a rewritten file is parsed again
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def load_json_file(path):
+    """Parse a results file, reusing the parsed data while the file is unchanged"""
+    return _load_json_file(path, os.stat(path).st_mtime_ns)
+
+# Resolves once the page's load event has fired, in a single WebDriver call
+# instead of polling for the body element
+_WAIT_FOR_LOAD_SCRIPT = """
+const done = arguments[arguments.length - 1];
+if (document.readyState === 'complete') {
+    done(true);
+} else {
+    window.addEventListener('load', () => done(true), {once: true});
+}
+"""
+
+def wait_for_load(driver):
+    """Block until the current page has loaded, up to the driver's script timeout"""
+    driver.execute_async_script(_WAIT_FOR_LOAD_SCRIPT)
+
+class TestGoogleNavigation(unittest.IsolatedAsyncioTestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test environment once before all tests"""
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        # chrome_options.add_argument("--headless")  # Uncomment for headless mode
-        cls.driver = webdriver.Chrome(options=chrome_options)
-        cls.wait = WebDriverWait(cls.driver, 10)
+        from driver_pool import DRIVER_POOL
+        import selenium_cotestpilot  # Adds the ai_check* and ai_report methods to WebDriver
+        TEST_RESULTS_DIR.mkdir(exist_ok=True)
+        # Open the API connection and load testers now, not in the first test
+        selenium_cotestpilot.warmup()
+        # Borrow an already running Chrome rather than starting one per class
+        cls.use_driver(DRIVER_POOL.acquire())
+        cls._batched_results = None
         logger.info("Test suite setup complete")
-        
+
+    @classmethod
+    def use_driver(cls, driver):
+        """Make driver the class driver and open Google on it"""
+        cls.driver = driver
+        # Bounds wait_for_load
+        cls.driver.set_script_timeout(LOAD_TIMEOUT)
+        # Every test looks at the same page, so load it once per driver
+        cls.goto(GOOGLE_URL)
+        # Read the page text once; the cache key and the checks all reuse it
+        cls._page_text = cls.driver.execute_script(
+            "return document.body ? document.body.innerText : ''")
+
+    @classmethod
+    def goto(cls, url):
+        """Open url and wait for its body, unless the driver is already there"""
+        if cls.driver.current_url.rstrip('/') == url.rstrip('/'):
+            return
+        cls.driver.get(url)
+        wait_for_load(cls.driver)
 
     @classmethod
     def tearDownClass(cls):
         """Clean up once after all tests"""
         if hasattr(cls, 'driver'):
-            cls.driver.quit()
-            logger.info("Browser session closed")
+            from driver_pool import DRIVER_POOL
+            DRIVER_POOL.release(cls.driver)
+            logger.info("Browser session returned to the pool")
+
+    async def batched_result(self, name):
+        """Result of one CHECK_VARIANTS check; the batch runs once per class"""
+        cls = type(self)
+        if cls._batched_results is None:
+            # The page is captured on this thread; only the model calls run in
+            # worker threads, keeping the driver on one thread
+            results = await cached_ai_check_batch(
+                self.driver, self._page_text,
+                variants=list(CHECK_VARIANTS.values())
+            )
+            cls._batched_results = dict(zip(CHECK_VARIANTS, results))
+        return cls._batched_results[name]
+
+    def assertMatchesSchema(self, validate, data, required):
+        """Validate data with a compiled schema, or check its required keys"""
+        if validate is not None:
+            try:
+                validate(data)
+            except fastjsonschema.JsonSchemaException as e:
+                self.fail(e.message)
+        else:
+            missing = required - data.keys()
+            self.assertFalse(missing, f"Missing fields: {sorted(missing)}")
 
     def setUp(self):
         """Reset browser state before each test"""
-        self.driver.delete_all_cookies()
+        from driver_pool import DRIVER_POOL
+        cls = type(self)
+        # The pool counts tests per driver across every class in the process,
+        # and asks for a fresh Chrome once one has served its share
+        if DRIVER_POOL.needs_restart(cls.driver):
+            logger.info("Restarting Chrome")
+            cls.use_driver(DRIVER_POOL.replace(cls.driver))
+        DRIVER_POOL.record_test(cls.driver)
+        # Clear only Google's cookies; the HTTP cache stays warm for reloads
+        self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": GOOGLE_URL,
+            "storageTypes": "cookies"
+        })
         logger.info("Test setup: Cookies cleared")
 
-    def test_google_navigation(self):
+    @slow
+    async def test_google_navigation(self):
         """Test navigation to Google homepage"""
         logger.info("Running test_google_navigation")
         try:
-            self.driver.get('https://www.google.com')
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            result = self.driver.ai_check()
-            logger.info(f"Successfully loaded Google! Page title: {self.driver.title}")
+            result = await self.batched_result('default')
+            # driver.title is a WebDriver round-trip, so only fetch it when it is logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Successfully loaded Google! Page title: %s", self.driver.title)
             self.assertIn("Google", self.driver.title)
         except Exception as e:
-            logger.error(f"Test failed: {str(e)}")
+            logger.error("Test failed: %s", e)
             raise
 
-    def test_ai_check_with_testers(self):
+    @slow
+    async def test_ai_check_with_testers(self):
         """Test AI checks with specific testing personas"""
         logger.info("Running test_ai_check_with_testers")
-        self.driver.get('https://www.google.com')
-        self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        
-        result = self.driver.ai_check(
-            testers=['Jason', 'Alice'],
-            label='google_homepage'
-        )
+        result = await self.batched_result('testers')
         
         self.assertTrue(hasattr(result, 'raw_response'))
         self.assertTrue(hasattr(result, 'profile'))
         self.assertEqual(result.profile, 'default')
 
-    def test_ai_check_with_custom_rules(self):
+    @slow
+    async def test_ai_check_with_custom_rules(self):
         """Test AI checks with custom accessibility rules"""
         logger.info("Running test_ai_check_with_custom_rules")
-        self.driver.get('https://www.google.com')
-        self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        
-        result = self.driver.ai_check(
-            custom_rules={
-                'check_contrast': True,
-                'min_font_size': 12
-            },
-            custom_prompt="Pay special attention to accessibility issues"
-        )
+        result = await self.batched_result('custom_rules')
         
         self.assertTrue(hasattr(result, 'raw_response'))
         self.assertIsInstance(result.raw_response, dict)
 
-    def test_check_result_structure(self):
+    @slow
+    async def test_check_result_structure(self):
         """Test the basic structure of CheckResult object"""
         logger.info("Running test_check_result_structure")
-        self.driver.get('https://www.google.com')
-        self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        result = await self.batched_result('default')
         
-        result = self.driver.ai_check()
-        
-        required_fields = ['timestamp', 'url', 'bugs', 'raw_response', 'profile']
-        for field in required_fields:
-            self.assertTrue(hasattr(result, field), f"Missing field: {field}")
+        self.assertMatchesSchema(validate_result, vars(result), REQUIRED_FIELDS)
         
         self.assertIsInstance(result.timestamp, datetime)
-        self.assertEqual(result.url, 'https://www.google.com/')
+        self.assertEqual(result.url, GOOGLE_URL + '/')
 
-    def test_bug_report_format(self):
+    @slow
+    async def test_bug_report_format(self):
         """Test the structure of individual bug reports"""
         logger.info("Running test_bug_report_format")
-        self.driver.get('https://www.google.com')
-        self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        
-        result = self.driver.ai_check()
+        result = await self.batched_result('default')
         
         self.assertIsInstance(result.bugs, list)
         
         if result.bugs:
             bug = result.bugs[0]
-            required_bug_fields = [
-                'title',
-                'severity',
-                'description',
-                'why_fix',
-                'how_to_fix',
-                'confidence'
-            ]
-            
-            for field in required_bug_fields:
-                self.assertIn(field, bug)
+            self.assertMatchesSchema(validate_bug, bug, REQUIRED_BUG_FIELDS)
             
             self.assertIsInstance(bug['confidence'], float)
             self.assertGreaterEqual(bug['confidence'], 0)
             self.assertLessEqual(bug['confidence'], 1)
 
-    def test_json_output_file(self):
+    @slow
+    async def test_json_output_file(self):
         """Test that results are properly saved to JSON file"""
         logger.info("Running test_json_output_file")
         test_label = 'test_output'
-        test_dir = os.path.join(os.path.dirname(__file__), 'test_results')
-        os.makedirs(test_dir, exist_ok=True)
         
-        self.driver.get('https://www.google.com')
-        self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        # This check writes its own output file, so give it a fresh render
+        # instead of the page state earlier tests have looked at
+        self.driver.refresh()
+        wait_for_load(self.driver)
 
-        result = self.driver.ai_check(
+        result = await self.driver.ai_check_async(
             custom_prompt="""
             Analyze the page for issues. If no real issues are found, generate 2  
             fictional issues for testing purposes. Make the issues sound plausible but clearly 
             marked as test data.
             """,
             label=test_label,
-            output_dir=test_dir
+            output_dir=str(TEST_RESULTS_DIR),
+            page_text=self._page_text
         )
         
         self.assertTrue(len(result.bugs) > 0, "No issues were found in the results")
         
-        self.assertTrue(os.path.exists(result.output_file))
+        self.assertTrue(Path(result.output_file).exists())
         
-        with open(result.output_file, 'r') as f:
-            saved_results = json.load(f)
+        saved_results = load_json_file(result.output_file)
         
         self.assertIn('timestamp', saved_results)
         self.assertIn('url', saved_results)
         self.assertIn('testers_results', saved_results)
         self.assertTrue(len(saved_results['testers_results']) > 0, "No issues were found in the saved JSON file")
 
-    def test_report_generation(self):
+    async def test_report_generation(self):
         """Test that AI check report generation works correctly"""
         logger.info("Running test_report_generation")
-        self.driver.get('https://www.google.com')
-        self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        
-        report_path = self.driver.ai_report()
+        # The report is written on the package's writer thread
+        report_path = self.driver.ai_report(background=True).result(timeout=30)
         self.assertTrue(os.path.exists(report_path))
 
+class TestResultCache(unittest.IsolatedAsyncioTestCase):
+    """The SQLite ai_check cache, exercised without a browser or the model"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db = os.path.join(tmp.name, 'cache.sqlite')
+        patcher = mock.patch(f'{__name__}.CACHE_ENABLED', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.driver = SimpleNamespace(current_url=GOOGLE_URL + '/')
+
+    def counting_check(self, raw_response):
+        """A cached check function returning raw_response, and its call list"""
+        calls = []
+
+        @lru_sqlite_cache(db=self.db, ttl=3600)
+        async def check(driver, page_text, **kwargs):
+            calls.append(kwargs)
+            return [SimpleNamespace(raw_response=raw_response, bugs=[])]
+
+        return check, calls
+
+    async def test_successful_result_served_from_cache(self):
+        check, calls = self.counting_check({'num_issues': 0})
+        await check(self.driver, 'Google Search', variants=[{}])
+        await check(self.driver, 'Google Search', variants=[{}])
+        self.assertEqual(len(calls), 1)
+
+    async def test_failed_result_not_cached(self):
+        check, calls = self.counting_check({'error': '429 Too Many Requests'})
+        await check(self.driver, 'Google Search', variants=[{}])
+        results = await check(self.driver, 'Google Search', variants=[{}])
+        self.assertEqual(len(calls), 2, "Failed result was served from the cache")
+        self.assertIn('error', results[0].raw_response)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file